@@ -5,707 +5,489 @@ Completes the IB-grade model with full valuation capabilities
 """
 
 from openpyxl import load_workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
 from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.table import Table, TableStyleInfo
-from openpyxl.chart import LineChart, BarChart, Reference
+
+from build_model import (INPUT_FILL, INPUT_FONT, register_named_styles, save_workbook,
+                         set_column_widths)
+from enhance_model import ENHANCE_STYLES
 
 # Color definitions
-INPUT_FILL = PatternFill(start_color="D6E4F5", end_color="D6E4F5", fill_type="solid")
-HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-SECTION_FILL = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-CHECK_PASS_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+SECTION_FILL = PatternFill(start_color="FFE7E6E6", end_color="FFE7E6E6", fill_type="solid")
+CHECK_PASS_FILL = PatternFill(start_color="FFC6EFCE", end_color="FFC6EFCE", fill_type="solid")
 
-INPUT_FONT = Font(color="0000FF", bold=True)
-HEADER_FONT = Font(color="FFFFFF", bold=True)
 BOLD_FONT = Font(bold=True)
+SUBTITLE_FONT = Font(size=12, italic=True)
+SCENARIO_FONT = Font(bold=True, color="FF0000FF")
+BIG_BLUE_FONT = Font(bold=True, size=14, color="FF4472C4")
+MID_BLUE_FONT = Font(bold=True, size=12, color="FF4472C4")
+CENTER_ALIGN = Alignment(horizontal='center')
+
+# Number formats
+NUMBER_FORMAT = '#,##0.0'
+PERCENT_FORMAT = '0.0%'
+MULTIPLE_FORMAT = '0.0x'
+CURRENCY_FORMAT = '$#,##0.00'
+
+# Named styles used only by the DCF tab and its valuation cells, registered on top of
+# build_model's NAMED_STYLES and enhance_model's ENHANCE_STYLES
+DCF_STYLES = (
+    NamedStyle(name="bold_center", font=BOLD_FONT, alignment=CENTER_ALIGN),
+    NamedStyle(name="bold_pct", font=BOLD_FONT, number_format=PERCENT_FORMAT),
+    NamedStyle(name="input_mult", font=INPUT_FONT, fill=INPUT_FILL, number_format=MULTIPLE_FORMAT),
+    NamedStyle(name="input_decimal", font=INPUT_FONT, fill=INPUT_FILL, number_format='0.00'),
+    NamedStyle(name="key_pct", font=BIG_BLUE_FONT,
+               number_format=PERCENT_FORMAT),
+    NamedStyle(name="key_num", font=MID_BLUE_FONT,
+               number_format=NUMBER_FORMAT),
+    NamedStyle(name="key_currency", font=BIG_BLUE_FONT,
+               number_format=CURRENCY_FORMAT),
+    NamedStyle(name="sens_pct", font=BOLD_FONT, fill=SECTION_FILL, number_format=PERCENT_FORMAT),
+    NamedStyle(name="sens_mult", font=BOLD_FONT, fill=SECTION_FILL, number_format=MULTIPLE_FORMAT),
+    NamedStyle(name="bold_currency", font=BOLD_FONT, number_format=CURRENCY_FORMAT),
+    NamedStyle(name="subtitle", font=SUBTITLE_FONT),
+    NamedStyle(name="scenario", font=SCENARIO_FONT),
+)
 
 # Years
 HISTORICAL_YEARS = [2021, 2022, 2023, 2024]
 FORECAST_YEARS = [2025, 2026, 2027, 2028, 2029]
 ALL_YEARS = HISTORICAL_YEARS + FORECAST_YEARS
 
-def set_column_widths(ws, widths):
-    """Set column widths for a worksheet"""
-    for col, width in widths.items():
-        ws.column_dimensions[col].width = width
+# Column letters by 1-based index (_COLS[3] == 'C'), precomputed for A-Z
+_COLS = ['', *map(get_column_letter, range(1, 27))]
+
+# DCF tab forecast columns (C, D, E, F, G - column B is a spacer)
+FCF_COLS = tuple(_COLS[3:3 + len(FORECAST_YEARS)])
+
+# Statement columns for the forecast years (F, G, H, I, J) and the final model year
+YEAR_COLS = tuple(_COLS[2 + len(HISTORICAL_YEARS):2 + len(ALL_YEARS)])
+LAST_YEAR_COL = _COLS[2 + len(ALL_YEARS) - 1]
+
+# Sheet prefixes for cross-sheet formulas
+ASSUMPTIONS_REF = "'Assumptions & Drivers'!"
+INCOME_REF = "'Income Statement'!"
+BALANCE_REF = "'Balance Sheet'!"
+DEBT_REF = "'Debt Schedule'!"
+CASH_FLOW_REF = "'Cash Flow'!"
+
+# Sensitivity table axes (filled in Excel with Data > What-If Analysis > Data Table)
+SENS_GROWTH_RATES = (0.015, 0.020, 0.025, 0.030, 0.035)
+SENS_WACC_RATES = (0.08, 0.09, 0.10, 0.11, 0.12)
+SENS_EXIT_MULTIPLES = (7.0, 7.5, 8.0, 8.5, 9.0, 9.5, 10.0)
+DATA_TABLE_NOTE = 'Note: Use Excel Data Table feature (Data > What-If Analysis > Data Table)'
+
+# Cells written into existing sheets: (address, value, named style, number format)
+VALUATION_CELLS = {
+    # DCF valuation summary and key assumptions, below the Summary charts data
+    "Summary": (
+        ('A30', 'DCF VALUATION SUMMARY', 'heading', None),
+        ('A32', 'Method', 'table_header', None),
+        ('B32', 'Enterprise Value', 'table_header', None),
+        ('C32', 'Equity Value', 'table_header', None),
+        ('D32', 'Value per Share', 'table_header', None),
+        ('A33', 'DCF - Perpetuity Growth', None, None),
+        ('B33', '=DCF!C60', None, NUMBER_FORMAT),
+        ('C33', '=DCF!C63', None, NUMBER_FORMAT),
+        ('D33', '=DCF!C66', None, CURRENCY_FORMAT),
+        ('A34', 'DCF - Exit Multiple', None, None),
+        ('B34', '=DCF!C73', None, NUMBER_FORMAT),
+        ('C34', '=DCF!C75', None, NUMBER_FORMAT),
+        ('D34', '=DCF!C76', None, CURRENCY_FORMAT),
+        ('A35', 'Midpoint', 'bold', None),
+        ('B35', '=(B33+B34)/2', 'bold_num', None),
+        ('C35', '=(C33+C34)/2', 'bold_num', None),
+        ('D35', '=(D33+D34)/2', 'bold_currency', None),
+        ('A37', 'KEY ASSUMPTIONS', 'subheading', None),
+        ('A38', 'WACC', None, None),
+        ('B38', '=DCF!C32', None, PERCENT_FORMAT),
+        ('A39', 'Terminal Growth Rate', None, None),
+        ('B39', '=DCF!C38', None, PERCENT_FORMAT),
+        ('A40', 'Exit EBITDA Multiple', None, None),
+        ('B40', '=DCF!C43', None, MULTIPLE_FORMAT),
+        ('A41', 'Terminal Year EBITDA', None, None),
+        ('B41', '=DCF!C42', None, NUMBER_FORMAT),
+    ),
+    # DCF checks below the existing checks, folded into the overall status
+    "Checks": (
+        ('A13', 'DCF CHECKS', 'header', None),
+        ('A14', 'WACC Check', 'bold', None),
+        ('B14', '=DCF!C32', None, PERCENT_FORMAT),
+        ('C14', '=IF(DCF!C32>0.05,IF(DCF!C32<0.20,"PASS","FAIL"),"FAIL")', 'check', None),
+        ('A15', 'Terminal Growth < WACC', 'bold', None),
+        ('B15', '=DCF!C38', None, PERCENT_FORMAT),
+        ('C15', '=IF(DCF!C38<DCF!C32,"PASS","FAIL")', 'check', None),
+        ('A16', 'Enterprise Value > 0', 'bold', None),
+        ('B16', '=DCF!C60', None, NUMBER_FORMAT),
+        ('C16', '=IF(DCF!C60>0,"PASS","FAIL")', 'check', None),
+        ('A17', 'Equity Value > 0', 'bold', None),
+        ('B17', '=DCF!C63', None, NUMBER_FORMAT),
+        ('C17', '=IF(DCF!C63>0,"PASS","FAIL")', 'check', None),
+        ('B12', '=IF(AND(COUNTIF(B8:K9,"FAIL")=0,COUNTIF(C14:C17,"FAIL")=0),'
+                '"ALL CHECKS PASS","ERRORS DETECTED")', None, None),
+    ),
+    # DCF / valuation inputs at the end of the sheet
+    "Assumptions & Drivers": (
+        ('A49', 'DCF / VALUATION ASSUMPTIONS', 'header', None),
+        ('A50', 'Fully Diluted Shares (mm)', None, None),
+        ('B50', 100, 'input_num', None),
+        ('A51', 'Risk-Free Rate', None, None),
+        ('B51', 0.045, 'input_pct', None),
+        ('A52', 'Equity Risk Premium', None, None),
+        ('B52', 0.065, 'input_pct', None),
+        ('A53', 'Beta', None, None),
+        ('B53', 1.2, 'input_decimal', None),
+        ('A54', 'Target Debt %', None, None),
+        ('B54', 0.30, 'input_pct', None),
+        ('A55', 'Terminal Growth Rate', None, None),
+        ('B55', 0.025, 'input_pct', None),
+        ('A56', 'Exit EV/EBITDA Multiple', None, None),
+        ('B56', 8.5, 'input_mult', None),
+    ),
+}
+
+def set_cell(ws, addr, value, style=None, number_format=None):
+    """Write a value to a cell, then apply a registered named style and/or a number format"""
+    cell = ws[addr]
+    cell.value = value
+    if style is not None:
+        cell.style = style
+    if number_format is not None:
+        cell.number_format = number_format
+    return cell
+
+def write_row(ws, row, col_start, values, number_format=None, style=None):
+    """Write a precomputed list of values across a row, starting at col_start"""
+    for i, value in enumerate(values):
+        cell = ws.cell(row=row, column=col_start + i, value=value)
+        if style is not None:
+            cell.style = style
+        elif number_format is not None:
+            cell.number_format = number_format
+
+def write_column(ws, row_start, col, values, style):
+    """Write a list of values down a column, starting at row_start"""
+    for i, value in enumerate(values):
+        ws.cell(row=row_start + i, column=col, value=value).style = style
 
 def create_dcf_tab(wb):
     """Create comprehensive DCF valuation tab"""
     print("  Creating DCF tab...")
 
-    # Check if sheet exists
-    if "DCF" in wb.sheetnames:
+    # Check if sheet exists (sheetnames rebuilds its list on every access, so snapshot it)
+    sheetnames = wb.sheetnames
+    if "DCF" in sheetnames:
         del wb["DCF"]
+        sheetnames = wb.sheetnames
 
     # Add after Cash Flow
-    cf_idx = wb.sheetnames.index("Cash Flow")
+    cf_idx = sheetnames.index("Cash Flow")
     ws = wb.create_sheet("DCF", cf_idx + 1)
 
-    # Set column widths
-    set_column_widths(ws, {
-        'A': 35, 'B': 4, 'C': 12, 'D': 12, 'E': 12, 'F': 12,
-        'G': 12, 'H': 12, 'I': 12, 'J': 12, 'K': 12
-    })
+    # Set column widths: label column, spacer, then the C-K value columns
+    set_column_widths(ws, {'A': 35, 'B': 4, **{col: 12 for col in _COLS[3:12]}})
 
     # Title
-    ws['A1'] = 'DCF VALUATION ANALYSIS'
-    ws['A1'].font = Font(size=16, bold=True, color="4472C4")
-    ws['A2'] = 'Unlevered Free Cash Flow Method'
-    ws['A2'].font = Font(size=12, italic=True)
+    set_cell(ws, 'A1', 'DCF VALUATION ANALYSIS', 'title')
+    set_cell(ws, 'A2', 'Unlevered Free Cash Flow Method', 'subtitle')
 
     # Current scenario indicator
-    ws['A3'] = 'Scenario:'
-    ws['B3'] = "='Assumptions & Drivers'!B4"
-    ws['B3'].font = Font(bold=True, color="0000FF")
+    set_cell(ws, 'A3', 'Scenario:')
+    set_cell(ws, 'B3', f"={ASSUMPTIONS_REF}B4", 'scenario')
 
     # SECTION 1: UNLEVERED FREE CASH FLOW
     row = 5
-    ws[f'A{row}'] = 'UNLEVERED FREE CASH FLOW'
-    ws[f'A{row}'].font = HEADER_FONT
-    ws[f'A{row}'].fill = HEADER_FILL
+    set_cell(ws, f'A{row}', 'UNLEVERED FREE CASH FLOW', 'header')
 
     # Year headers (forecast years only for DCF)
     row = 6
-    ws[f'A{row}'] = 'Period'
-    ws[f'A{row}'].font = BOLD_FONT
+    set_cell(ws, f'A{row}', 'Period', 'bold')
 
     col_start = 3  # Column C (skip B for spacing)
-    for i, year in enumerate(FORECAST_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = year
-        ws[f'{col}{row}'].font = HEADER_FONT
-        ws[f'{col}{row}'].fill = HEADER_FILL
-        ws[f'{col}{row}'].alignment = Alignment(horizontal='center')
+    write_row(ws, row, col_start, FORECAST_YEARS, style='year_header')
 
     # EBIT
     row = 7
-    ws[f'A{row}'] = 'EBIT'
-    for i, year in enumerate(FORECAST_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(2 + 4 + i)  # F, G, H, I, J for forecast years
-        ws[f'{col}{row}'] = f"='Income Statement'!{year_col}16"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    set_cell(ws, f'A{row}', 'EBIT')
+    write_row(ws, row, col_start, [f"={INCOME_REF}{c}16" for c in YEAR_COLS], NUMBER_FORMAT)
 
     # Tax Rate
     row = 8
-    ws[f'A{row}'] = 'Tax Rate'
-    for i, year in enumerate(FORECAST_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(2 + 4 + i)
-        ws[f'{col}{row}'] = f"='Assumptions & Drivers'!$B$30"
-        ws[f'{col}{row}'].number_format = '0.0%'
+    set_cell(ws, f'A{row}', 'Tax Rate')
+    write_row(ws, row, col_start, [f"={ASSUMPTIONS_REF}$B$30"] * len(FORECAST_YEARS),
+              PERCENT_FORMAT)
 
     # NOPAT (EBIT * (1-Tax))
     row = 9
-    ws[f'A{row}'] = 'NOPAT (EBIT × (1-Tax))'
-    ws[f'A{row}'].font = BOLD_FONT
-    for i, year in enumerate(FORECAST_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}7*(1-{col}8)"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
+    set_cell(ws, f'A{row}', 'NOPAT (EBIT × (1-Tax))', 'bold')
+    write_row(ws, row, col_start, [f"={c}7*(1-{c}8)" for c in FCF_COLS], style='bold_num')
 
     # Plus: D&A
     row = 10
-    ws[f'A{row}'] = 'Plus: D&A'
-    for i, year in enumerate(FORECAST_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(2 + 4 + i)
-        ws[f'{col}{row}'] = f"='Income Statement'!{year_col}14"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    set_cell(ws, f'A{row}', 'Plus: D&A')
+    write_row(ws, row, col_start, [f"={INCOME_REF}{c}14" for c in YEAR_COLS], NUMBER_FORMAT)
 
     # Less: CapEx
     row = 11
-    ws[f'A{row}'] = 'Less: CapEx'
-    for i, year in enumerate(FORECAST_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(2 + 4 + i)
-        ws[f'{col}{row}'] = f"='Cash Flow'!{year_col}18"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-
-    # Less: Change in NWC
+    set_cell(ws, f'A{row}', 'Less: CapEx')
+    write_row(ws, row, col_start, [f"={CASH_FLOW_REF}{c}18" for c in YEAR_COLS], NUMBER_FORMAT)
+
+    # Less: Change in NWC (sum of working capital changes)
     row = 12
-    ws[f'A{row}'] = 'Less: Increase in NWC'
-    for i, year in enumerate(FORECAST_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(2 + 4 + i)
-        # Sum of working capital changes
-        ws[f'{col}{row}'] = f"=-SUM('Cash Flow'!{year_col}9:{year_col}13)"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    set_cell(ws, f'A{row}', 'Less: Increase in NWC')
+    write_row(ws, row, col_start, [f"=-SUM({CASH_FLOW_REF}{c}9:{c}13)" for c in YEAR_COLS],
+              NUMBER_FORMAT)
 
     # Unlevered FCF
     row = 13
     fcf_row = row
-    ws[f'A{row}'] = 'Unlevered Free Cash Flow'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
-    for i, year in enumerate(FORECAST_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}9+{col}10+{col}11+{col}12"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
+    set_cell(ws, f'A{row}', 'Unlevered Free Cash Flow', 'section')
+    write_row(ws, row, col_start, [f"={c}9+{c}10+{c}11+{c}12" for c in FCF_COLS],
+              style='bold_num')
 
     # SECTION 2: WACC CALCULATION
     row = 16
-    ws[f'A{row}'] = 'WACC CALCULATION'
-    ws[f'A{row}'].font = HEADER_FONT
-    ws[f'A{row}'].fill = HEADER_FILL
+    set_cell(ws, f'A{row}', 'WACC CALCULATION', 'header')
 
     # Cost of Equity (CAPM)
     row = 17
-    ws[f'A{row}'] = 'Cost of Equity (CAPM)'
-    ws[f'A{row}'].font = BOLD_FONT
+    set_cell(ws, f'A{row}', 'Cost of Equity (CAPM)', 'bold')
 
     row = 18
-    ws[f'A{row}'] = 'Risk-Free Rate'
-    ws['C18'] = 0.045
-    ws['C18'].fill = INPUT_FILL
-    ws['C18'].font = INPUT_FONT
-    ws['C18'].number_format = '0.0%'
+    set_cell(ws, f'A{row}', 'Risk-Free Rate')
+    set_cell(ws, 'C18', 0.045, 'input_pct')
 
     row = 19
-    ws[f'A{row}'] = 'Equity Risk Premium'
-    ws['C19'] = 0.065
-    ws['C19'].fill = INPUT_FILL
-    ws['C19'].font = INPUT_FONT
-    ws['C19'].number_format = '0.0%'
+    set_cell(ws, f'A{row}', 'Equity Risk Premium')
+    set_cell(ws, 'C19', 0.065, 'input_pct')
 
     row = 20
-    ws[f'A{row}'] = 'Beta'
-    ws['C20'] = 1.2
-    ws['C20'].fill = INPUT_FILL
-    ws['C20'].font = INPUT_FONT
-    ws['C20'].number_format = '0.00'
+    set_cell(ws, f'A{row}', 'Beta')
+    set_cell(ws, 'C20', 1.2, 'input_decimal')
 
     row = 21
-    ws[f'A{row}'] = 'Cost of Equity'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws['C21'] = '=C18+C20*C19'
-    ws['C21'].number_format = '0.0%'
-    ws['C21'].font = BOLD_FONT
+    set_cell(ws, f'A{row}', 'Cost of Equity', 'bold')
+    set_cell(ws, 'C21', '=C18+C20*C19', 'bold_pct')
 
     # Cost of Debt
     row = 23
-    ws[f'A{row}'] = 'Cost of Debt'
-    ws[f'A{row}'].font = BOLD_FONT
+    set_cell(ws, f'A{row}', 'Cost of Debt', 'bold')
 
     row = 24
-    ws[f'A{row}'] = 'Pre-Tax Cost of Debt'
-    ws['C24'] = "=('Assumptions & Drivers'!B40+'Assumptions & Drivers'!B41)/2"
-    ws['C24'].number_format = '0.0%'
+    set_cell(ws, f'A{row}', 'Pre-Tax Cost of Debt')
+    set_cell(ws, 'C24', f"=({ASSUMPTIONS_REF}B40+{ASSUMPTIONS_REF}B41)/2", number_format=PERCENT_FORMAT)
 
     row = 25
-    ws[f'A{row}'] = 'Tax Rate'
-    ws['C25'] = "='Assumptions & Drivers'!B30"
-    ws['C25'].number_format = '0.0%'
+    set_cell(ws, f'A{row}', 'Tax Rate')
+    set_cell(ws, 'C25', f"={ASSUMPTIONS_REF}B30", number_format=PERCENT_FORMAT)
 
     row = 26
-    ws[f'A{row}'] = 'After-Tax Cost of Debt'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws['C26'] = '=C24*(1-C25)'
-    ws['C26'].number_format = '0.0%'
-    ws['C26'].font = BOLD_FONT
+    set_cell(ws, f'A{row}', 'After-Tax Cost of Debt', 'bold')
+    set_cell(ws, 'C26', '=C24*(1-C25)', 'bold_pct')
 
     # Capital Structure
     row = 28
-    ws[f'A{row}'] = 'Target Capital Structure'
-    ws[f'A{row}'].font = BOLD_FONT
+    set_cell(ws, f'A{row}', 'Target Capital Structure', 'bold')
 
     row = 29
-    ws[f'A{row}'] = 'Target Debt %'
-    ws['C29'] = 0.30
-    ws['C29'].fill = INPUT_FILL
-    ws['C29'].font = INPUT_FONT
-    ws['C29'].number_format = '0.0%'
+    set_cell(ws, f'A{row}', 'Target Debt %')
+    set_cell(ws, 'C29', 0.30, 'input_pct')
 
     row = 30
-    ws[f'A{row}'] = 'Target Equity %'
-    ws['C30'] = '=1-C29'
-    ws['C30'].number_format = '0.0%'
+    set_cell(ws, f'A{row}', 'Target Equity %')
+    set_cell(ws, 'C30', '=1-C29', number_format=PERCENT_FORMAT)
 
     # WACC
     row = 32
-    ws[f'A{row}'] = 'WACC'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
-    ws['C32'] = '=C21*C30+C26*C29'
-    ws['C32'].number_format = '0.0%'
-    ws['C32'].font = Font(bold=True, size=14, color="4472C4")
+    set_cell(ws, f'A{row}', 'WACC', 'section')
+    set_cell(ws, 'C32', '=C21*C30+C26*C29', 'key_pct')
 
     # SECTION 3: TERMINAL VALUE
     row = 35
-    ws[f'A{row}'] = 'TERMINAL VALUE CALCULATION'
-    ws[f'A{row}'].font = HEADER_FONT
-    ws[f'A{row}'].fill = HEADER_FILL
+    set_cell(ws, f'A{row}', 'TERMINAL VALUE CALCULATION', 'header')
 
     # Perpetuity Growth Method
     row = 36
-    ws[f'A{row}'] = 'Method 1: Perpetuity Growth'
-    ws[f'A{row}'].font = BOLD_FONT
+    set_cell(ws, f'A{row}', 'Method 1: Perpetuity Growth', 'bold')
 
     row = 37
-    ws[f'A{row}'] = 'Terminal Year FCF'
-    ws['C37'] = f"={get_column_letter(col_start + len(FORECAST_YEARS) - 1)}{fcf_row}"
-    ws['C37'].number_format = '#,##0.0'
+    set_cell(ws, f'A{row}', 'Terminal Year FCF')
+    set_cell(ws, 'C37', f"={_COLS[col_start + len(FORECAST_YEARS) - 1]}{fcf_row}",
+             number_format=NUMBER_FORMAT)
 
     row = 38
-    ws[f'A{row}'] = 'Perpetual Growth Rate'
-    ws['C38'] = 0.025
-    ws['C38'].fill = INPUT_FILL
-    ws['C38'].font = INPUT_FONT
-    ws['C38'].number_format = '0.0%'
+    set_cell(ws, f'A{row}', 'Perpetual Growth Rate')
+    set_cell(ws, 'C38', 0.025, 'input_pct')
 
     row = 39
-    ws[f'A{row}'] = 'Terminal Value (Perpetuity)'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws['C39'] = '=C37*(1+C38)/(C32-C38)'
-    ws['C39'].number_format = '#,##0.0'
-    ws['C39'].font = BOLD_FONT
+    set_cell(ws, f'A{row}', 'Terminal Value (Perpetuity)', 'bold')
+    set_cell(ws, 'C39', '=C37*(1+C38)/(C32-C38)', 'bold_num')
 
     # Exit Multiple Method
     row = 41
-    ws[f'A{row}'] = 'Method 2: Exit Multiple'
-    ws[f'A{row}'].font = BOLD_FONT
+    set_cell(ws, f'A{row}', 'Method 2: Exit Multiple', 'bold')
 
     row = 42
-    ws[f'A{row}'] = 'Terminal Year EBITDA'
-    last_year_col = get_column_letter(2 + len(ALL_YEARS) - 1)
-    ws['C42'] = f"='Income Statement'!{last_year_col}22"
-    ws['C42'].number_format = '#,##0.0'
+    set_cell(ws, f'A{row}', 'Terminal Year EBITDA')
+    set_cell(ws, 'C42', f"={INCOME_REF}{LAST_YEAR_COL}22", number_format=NUMBER_FORMAT)
 
     row = 43
-    ws[f'A{row}'] = 'Exit EV/EBITDA Multiple'
-    ws['C43'] = 8.5
-    ws['C43'].fill = INPUT_FILL
-    ws['C43'].font = INPUT_FONT
-    ws['C43'].number_format = '0.0x'
+    set_cell(ws, f'A{row}', 'Exit EV/EBITDA Multiple')
+    set_cell(ws, 'C43', 8.5, 'input_mult')
 
     row = 44
-    ws[f'A{row}'] = 'Terminal Value (Exit Multiple)'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws['C44'] = '=C42*C43'
-    ws['C44'].number_format = '#,##0.0'
-    ws['C44'].font = BOLD_FONT
+    set_cell(ws, f'A{row}', 'Terminal Value (Exit Multiple)', 'bold')
+    set_cell(ws, 'C44', '=C42*C43', 'bold_num')
 
     # SECTION 4: DCF VALUATION
     row = 47
-    ws[f'A{row}'] = 'DCF VALUATION - PERPETUITY GROWTH'
-    ws[f'A{row}'].font = HEADER_FONT
-    ws[f'A{row}'].fill = HEADER_FILL
+    set_cell(ws, f'A{row}', 'DCF VALUATION - PERPETUITY GROWTH', 'header')
 
     # Discount periods
     row = 48
-    ws[f'A{row}'] = 'Period'
+    set_cell(ws, f'A{row}', 'Period')
     col_start_val = 3
-    for i, year in enumerate(FORECAST_YEARS):
-        col = get_column_letter(col_start_val + i)
-        ws[f'{col}{row}'] = year
-        ws[f'{col}{row}'].font = BOLD_FONT
-        ws[f'{col}{row}'].alignment = Alignment(horizontal='center')
+    write_row(ws, row, col_start_val, FORECAST_YEARS, style='bold_center')
 
     row = 49
-    ws[f'A{row}'] = 'Discount Period (years)'
-    for i in range(len(FORECAST_YEARS)):
-        col = get_column_letter(col_start_val + i)
-        ws[f'{col}{row}'] = i + 1
-        ws[f'{col}{row}'].number_format = '0.0'
+    set_cell(ws, f'A{row}', 'Discount Period (years)')
+    write_row(ws, row, col_start_val, range(1, len(FORECAST_YEARS) + 1), '0.0')
 
     row = 50
-    ws[f'A{row}'] = 'Unlevered FCF'
-    for i in range(len(FORECAST_YEARS)):
-        col = get_column_letter(col_start_val + i)
-        ws[f'{col}{row}'] = f"={col}{fcf_row}"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    set_cell(ws, f'A{row}', 'Unlevered FCF')
+    write_row(ws, row, col_start_val, [f"={c}{fcf_row}" for c in FCF_COLS], NUMBER_FORMAT)
 
     row = 51
-    ws[f'A{row}'] = 'Discount Factor'
-    for i in range(len(FORECAST_YEARS)):
-        col = get_column_letter(col_start_val + i)
-        ws[f'{col}{row}'] = f"=1/(1+$C$32)^{col}49"
-        ws[f'{col}{row}'].number_format = '0.000'
+    set_cell(ws, f'A{row}', 'Discount Factor')
+    write_row(ws, row, col_start_val, [f"=1/(1+$C$32)^{c}49" for c in FCF_COLS], '0.000')
+    # Final-year discount factor, shared by both terminal value methods
+    last_forecast_col = FCF_COLS[-1]
+    terminal_discount = f"{last_forecast_col}51"
 
     row = 52
-    ws[f'A{row}'] = 'PV of FCF'
-    ws[f'A{row}'].font = BOLD_FONT
-    for i in range(len(FORECAST_YEARS)):
-        col = get_column_letter(col_start_val + i)
-        ws[f'{col}{row}'] = f"={col}50*{col}51"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
+    set_cell(ws, f'A{row}', 'PV of FCF', 'bold')
+    write_row(ws, row, col_start_val, [f"={c}50*{c}51" for c in FCF_COLS], style='bold_num')
 
     # Terminal Value PV
     row = 54
-    ws[f'A{row}'] = 'Terminal Value'
-    last_forecast_col = get_column_letter(col_start_val + len(FORECAST_YEARS) - 1)
-    ws[f'{last_forecast_col}{row}'] = '=C39'
-    ws[f'{last_forecast_col}{row}'].number_format = '#,##0.0'
+    set_cell(ws, f'A{row}', 'Terminal Value')
+    set_cell(ws, f'{last_forecast_col}{row}', '=C39', number_format=NUMBER_FORMAT)
 
     row = 55
-    ws[f'A{row}'] = 'PV of Terminal Value'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'{last_forecast_col}{row}'] = f"={last_forecast_col}54*{last_forecast_col}51"
-    ws[f'{last_forecast_col}{row}'].number_format = '#,##0.0'
-    ws[f'{last_forecast_col}{row}'].font = BOLD_FONT
+    set_cell(ws, f'A{row}', 'PV of Terminal Value', 'bold')
+    set_cell(ws, f'{last_forecast_col}{row}', f"={last_forecast_col}54*{terminal_discount}", 'bold_num')
 
     # Valuation Summary
     row = 57
-    ws[f'A{row}'] = 'VALUATION SUMMARY (Perpetuity)'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
+    set_cell(ws, f'A{row}', 'VALUATION SUMMARY (Perpetuity)', 'section')
 
     row = 58
-    ws[f'A{row}'] = 'PV of Forecast FCFs'
-    ws['C58'] = f"=SUM(C52:{last_forecast_col}52)"
-    ws['C58'].number_format = '#,##0.0'
+    set_cell(ws, f'A{row}', 'PV of Forecast FCFs')
+    set_cell(ws, 'C58', f"=SUM(C52:{last_forecast_col}52)", number_format=NUMBER_FORMAT)
 
     row = 59
-    ws[f'A{row}'] = 'PV of Terminal Value'
-    ws['C59'] = f"={last_forecast_col}55"
-    ws['C59'].number_format = '#,##0.0'
+    set_cell(ws, f'A{row}', 'PV of Terminal Value')
+    set_cell(ws, 'C59', f"={last_forecast_col}55", number_format=NUMBER_FORMAT)
 
     row = 60
-    ws[f'A{row}'] = 'Enterprise Value'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws['C60'] = '=C58+C59'
-    ws['C60'].number_format = '#,##0.0'
-    ws['C60'].font = BOLD_FONT
+    set_cell(ws, f'A{row}', 'Enterprise Value', 'bold')
+    set_cell(ws, 'C60', '=C58+C59', 'bold_num')
 
     # Net Debt Bridge
     row = 62
-    ws[f'A{row}'] = 'Less: Net Debt'
-    last_year_col = get_column_letter(2 + len(ALL_YEARS) - 1)
-    ws['C62'] = f"='Debt Schedule'!{last_year_col}17-'Balance Sheet'!{last_year_col}7"
-    ws['C62'].number_format = '#,##0.0'
+    set_cell(ws, f'A{row}', 'Less: Net Debt')
+    set_cell(ws, 'C62', f"={DEBT_REF}{LAST_YEAR_COL}17-{BALANCE_REF}{LAST_YEAR_COL}7", number_format=NUMBER_FORMAT)
 
     row = 63
-    ws[f'A{row}'] = 'Equity Value'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
-    ws['C63'] = '=C60-C62'
-    ws['C63'].number_format = '#,##0.0'
-    ws['C63'].font = Font(bold=True, size=12, color="4472C4")
+    set_cell(ws, f'A{row}', 'Equity Value', 'section')
+    set_cell(ws, 'C63', '=C60-C62', 'key_num')
 
     # Per Share
     row = 65
-    ws[f'A{row}'] = 'Fully Diluted Shares (mm)'
-    ws['C65'] = 100
-    ws['C65'].fill = INPUT_FILL
-    ws['C65'].font = INPUT_FONT
-    ws['C65'].number_format = '#,##0.0'
+    set_cell(ws, f'A{row}', 'Fully Diluted Shares (mm)')
+    set_cell(ws, 'C65', 100, 'input_num')
 
     row = 66
-    ws[f'A{row}'] = 'Equity Value Per Share'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
-    ws['C66'] = '=C63/C65'
-    ws['C66'].number_format = '$#,##0.00'
-    ws['C66'].font = Font(bold=True, size=14, color="4472C4")
+    set_cell(ws, f'A{row}', 'Equity Value Per Share', 'section')
+    set_cell(ws, 'C66', '=C63/C65', 'key_currency')
 
     # EXIT MULTIPLE VALUATION
     row = 69
-    ws[f'A{row}'] = 'DCF VALUATION - EXIT MULTIPLE'
-    ws[f'A{row}'].font = HEADER_FONT
-    ws[f'A{row}'].fill = HEADER_FILL
+    set_cell(ws, f'A{row}', 'DCF VALUATION - EXIT MULTIPLE', 'header')
 
     row = 70
-    ws[f'A{row}'] = 'PV of Forecast FCFs'
-    ws['C70'] = '=C58'
-    ws['C70'].number_format = '#,##0.0'
+    set_cell(ws, f'A{row}', 'PV of Forecast FCFs')
+    set_cell(ws, 'C70', '=C58', number_format=NUMBER_FORMAT)
 
     row = 71
-    ws[f'A{row}'] = 'Terminal Value (Exit Multiple)'
-    ws['C71'] = '=C44'
-    ws['C71'].number_format = '#,##0.0'
+    set_cell(ws, f'A{row}', 'Terminal Value (Exit Multiple)')
+    set_cell(ws, 'C71', '=C44', number_format=NUMBER_FORMAT)
 
     row = 72
-    ws[f'A{row}'] = 'PV of Terminal Value'
-    ws['C72'] = f"=C71*{last_forecast_col}51"
-    ws['C72'].number_format = '#,##0.0'
+    set_cell(ws, f'A{row}', 'PV of Terminal Value')
+    set_cell(ws, 'C72', f"=C71*{terminal_discount}", number_format=NUMBER_FORMAT)
 
     row = 73
-    ws[f'A{row}'] = 'Enterprise Value'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws['C73'] = '=C70+C72'
-    ws['C73'].number_format = '#,##0.0'
-    ws['C73'].font = BOLD_FONT
+    set_cell(ws, f'A{row}', 'Enterprise Value', 'bold')
+    set_cell(ws, 'C73', '=C70+C72', 'bold_num')
 
     row = 74
-    ws[f'A{row}'] = 'Less: Net Debt'
-    ws['C74'] = '=C62'
-    ws['C74'].number_format = '#,##0.0'
+    set_cell(ws, f'A{row}', 'Less: Net Debt')
+    set_cell(ws, 'C74', '=C62', number_format=NUMBER_FORMAT)
 
     row = 75
-    ws[f'A{row}'] = 'Equity Value'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
-    ws['C75'] = '=C73-C74'
-    ws['C75'].number_format = '#,##0.0'
-    ws['C75'].font = Font(bold=True, size=12, color="4472C4")
+    set_cell(ws, f'A{row}', 'Equity Value', 'section')
+    set_cell(ws, 'C75', '=C73-C74', 'key_num')
 
     row = 76
-    ws[f'A{row}'] = 'Equity Value Per Share'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
-    ws['C76'] = '=C75/C65'
-    ws['C76'].number_format = '$#,##0.00'
-    ws['C76'].font = Font(bold=True, size=14, color="4472C4")
-
-    # SENSITIVITY TABLES
-    row = 79
-    ws[f'A{row}'] = 'SENSITIVITY ANALYSIS'
-    ws[f'A{row}'].font = HEADER_FONT
-    ws[f'A{row}'].fill = HEADER_FILL
-
-    row = 80
-    ws[f'A{row}'] = 'Equity Value per Share Sensitivity (Perpetuity Method)'
-    ws[f'A{row}'].font = BOLD_FONT
-
-    # Create 2-way table: WACC vs Terminal Growth
-    # Headers
-    row = 81
-    ws[f'A{row}'] = 'WACC / Growth Rate'
-    ws[f'A{row}'].font = BOLD_FONT
-
-    # Growth rates across top
-    growth_rates = [0.015, 0.020, 0.025, 0.030, 0.035]
-    for i, rate in enumerate(growth_rates):
-        col = get_column_letter(3 + i)  # C, D, E, F, G
-        ws[f'{col}{row}'] = rate
-        ws[f'{col}{row}'].number_format = '0.0%'
-        ws[f'{col}{row}'].font = BOLD_FONT
-        ws[f'{col}{row}'].fill = SECTION_FILL
-
-    # WACC down the side
-    wacc_rates = [0.08, 0.09, 0.10, 0.11, 0.12]
-    for i, rate in enumerate(wacc_rates):
-        row = 82 + i
-        ws[f'A{row}'] = rate
-        ws[f'A{row}'].number_format = '0.0%'
-        ws[f'A{row}'].font = BOLD_FONT
-        ws[f'A{row}'].fill = SECTION_FILL
-
-    # Add note about data table
-    ws['A88'] = 'Note: Use Excel Data Table feature (Data > What-If Analysis > Data Table)'
-    ws['A88'].font = Font(italic=True, size=9)
-    ws['A89'] = 'Row input: C38 (Growth Rate), Column input: C32 (WACC)'
-    ws['A89'].font = Font(italic=True, size=9)
-
-    # Add second sensitivity table for Exit Multiple method
-    row = 92
-    ws[f'A{row}'] = 'Equity Value per Share Sensitivity (Exit Multiple Method)'
-    ws[f'A{row}'].font = BOLD_FONT
-
-    row = 93
-    ws[f'A{row}'] = 'WACC / Exit Multiple'
-    ws[f'A{row}'].font = BOLD_FONT
-
-    # Exit multiples across top
-    exit_multiples = [7.0, 7.5, 8.0, 8.5, 9.0, 9.5, 10.0]
-    for i, mult in enumerate(exit_multiples):
-        col = get_column_letter(3 + i)
-        ws[f'{col}{row}'] = mult
-        ws[f'{col}{row}'].number_format = '0.0x'
-        ws[f'{col}{row}'].font = BOLD_FONT
-        ws[f'{col}{row}'].fill = SECTION_FILL
-
-    # WACC down the side
-    for i, rate in enumerate(wacc_rates):
-        row = 94 + i
-        ws[f'A{row}'] = rate
-        ws[f'A{row}'].number_format = '0.0%'
-        ws[f'A{row}'].font = BOLD_FONT
-        ws[f'A{row}'].fill = SECTION_FILL
-
-    ws['A100'] = 'Note: Use Excel Data Table feature (Data > What-If Analysis > Data Table)'
-    ws['A100'].font = Font(italic=True, size=9)
-    ws['A101'] = 'Row input: C43 (Exit Multiple), Column input: C32 (WACC)'
-    ws['A101'].font = Font(italic=True, size=9)
-
-def enhance_summary_with_valuation(ws):
-    """Add DCF valuation outputs to Summary tab"""
-    print("  Enhancing Summary tab with valuation...")
-
-    # Add valuation section after existing content
-    row = 30
-    ws[f'A{row}'] = 'DCF VALUATION SUMMARY'
-    ws[f'A{row}'].font = Font(size=14, bold=True)
-
-    row = 32
-    ws[f'A{row}'] = 'Method'
-    ws[f'B{row}'] = 'Enterprise Value'
-    ws[f'C{row}'] = 'Equity Value'
-    ws[f'D{row}'] = 'Value per Share'
-
-    for col in ['A', 'B', 'C', 'D']:
-        ws[col + str(row)].font = BOLD_FONT
-        ws[col + str(row)].fill = HEADER_FILL
-
-    # Perpetuity Growth Method
-    row = 33
-    ws[f'A{row}'] = 'DCF - Perpetuity Growth'
-    ws[f'B{row}'] = '=DCF!C60'
-    ws[f'C{row}'] = '=DCF!C63'
-    ws[f'D{row}'] = '=DCF!C66'
-
-    ws[f'B{row}'].number_format = '#,##0.0'
-    ws[f'C{row}'].number_format = '#,##0.0'
-    ws[f'D{row}'].number_format = '$#,##0.00'
-
-    # Exit Multiple Method
-    row = 34
-    ws[f'A{row}'] = 'DCF - Exit Multiple'
-    ws[f'B{row}'] = '=DCF!C73'
-    ws[f'C{row}'] = '=DCF!C75'
-    ws[f'D{row}'] = '=DCF!C76'
-
-    ws[f'B{row}'].number_format = '#,##0.0'
-    ws[f'C{row}'].number_format = '#,##0.0'
-    ws[f'D{row}'].number_format = '$#,##0.00'
-
-    # Midpoint
-    row = 35
-    ws[f'A{row}'] = 'Midpoint'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'B{row}'] = '=(B33+B34)/2'
-    ws[f'C{row}'] = '=(C33+C34)/2'
-    ws[f'D{row}'] = '=(D33+D34)/2'
-
-    ws[f'B{row}'].number_format = '#,##0.0'
-    ws[f'C{row}'].number_format = '#,##0.0'
-    ws[f'D{row}'].number_format = '$#,##0.00'
-    ws[f'B{row}'].font = BOLD_FONT
-    ws[f'C{row}'].font = BOLD_FONT
-    ws[f'D{row}'].font = BOLD_FONT
-
-    # Key assumptions
-    row = 37
-    ws[f'A{row}'] = 'KEY ASSUMPTIONS'
-    ws[f'A{row}'].font = Font(size=12, bold=True)
-
-    row = 38
-    ws[f'A{row}'] = 'WACC'
-    ws[f'B{row}'] = '=DCF!C32'
-    ws[f'B{row}'].number_format = '0.0%'
-
-    row = 39
-    ws[f'A{row}'] = 'Terminal Growth Rate'
-    ws[f'B{row}'] = '=DCF!C38'
-    ws[f'B{row}'].number_format = '0.0%'
-
-    row = 40
-    ws[f'A{row}'] = 'Exit EBITDA Multiple'
-    ws[f'B{row}'] = '=DCF!C43'
-    ws[f'B{row}'].number_format = '0.0x'
-
-    row = 41
-    ws[f'A{row}'] = 'Terminal Year EBITDA'
-    ws[f'B{row}'] = '=DCF!C42'
-    ws[f'B{row}'].number_format = '#,##0.0'
-
-def enhance_checks_with_dcf(ws):
-    """Add DCF validation checks"""
-    print("  Enhancing Checks tab with DCF validation...")
-
-    # Add DCF checks below existing checks
-    row = 13
-    ws[f'A{row}'] = 'DCF CHECKS'
-    ws[f'A{row}'].font = HEADER_FONT
-    ws[f'A{row}'].fill = HEADER_FILL
-
-    row = 14
-    ws[f'A{row}'] = 'WACC Check'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws['B14'] = '=DCF!C32'
-    ws['B14'].number_format = '0.0%'
-    ws['C14'] = '=IF(DCF!C32>0.05,IF(DCF!C32<0.20,"PASS","FAIL"),"FAIL")'
-    ws['C14'].font = Font(bold=True, color="006100")
-
-    row = 15
-    ws[f'A{row}'] = 'Terminal Growth < WACC'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws['B15'] = '=DCF!C38'
-    ws['B15'].number_format = '0.0%'
-    ws['C15'] = '=IF(DCF!C38<DCF!C32,"PASS","FAIL")'
-    ws['C15'].font = Font(bold=True, color="006100")
-
-    row = 16
-    ws[f'A{row}'] = 'Enterprise Value > 0'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws['B16'] = '=DCF!C60'
-    ws['B16'].number_format = '#,##0.0'
-    ws['C16'] = '=IF(DCF!C60>0,"PASS","FAIL")'
-    ws['C16'].font = Font(bold=True, color="006100")
-
-    row = 17
-    ws[f'A{row}'] = 'Equity Value > 0'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws['B17'] = '=DCF!C63'
-    ws['B17'].number_format = '#,##0.0'
-    ws['C17'] = '=IF(DCF!C63>0,"PASS","FAIL")'
-    ws['C17'].font = Font(bold=True, color="006100")
-
-    # Update overall check
-    ws['B12'] = '=IF(AND(COUNTIF(B8:K9,"FAIL")=0,COUNTIF(C14:C17,"FAIL")=0),"ALL CHECKS PASS","ERRORS DETECTED")'
-
-def add_valuation_assumptions_section(ws):
-    """Add DCF/Valuation assumptions to Assumptions & Drivers"""
-    print("  Adding valuation assumptions to Assumptions & Drivers...")
-
-    # Add at the end of the sheet
-    row = 49
-    ws[f'A{row}'] = 'DCF / VALUATION ASSUMPTIONS'
-    ws[f'A{row}'].font = HEADER_FONT
-    ws[f'A{row}'].fill = HEADER_FILL
-
-    row = 50
-    ws[f'A{row}'] = 'Fully Diluted Shares (mm)'
-    ws['B50'] = 100
-    ws['B50'].fill = INPUT_FILL
-    ws['B50'].font = INPUT_FONT
-    ws['B50'].number_format = '#,##0.0'
+    set_cell(ws, f'A{row}', 'Equity Value Per Share', 'section')
+    set_cell(ws, 'C76', '=C75/C65', 'key_currency')
+
+    # SENSITIVITY TABLES - axis scaffolds only; the grid is an Excel Data Table
+    set_cell(ws, 'A79', 'SENSITIVITY ANALYSIS', 'header')
+
+    # 2-way table: WACC vs Terminal Growth
+    set_cell(ws, 'A80', 'Equity Value per Share Sensitivity (Perpetuity Method)', 'bold')
+    set_cell(ws, 'A81', 'WACC / Growth Rate', 'bold')
+    write_row(ws, 81, 3, SENS_GROWTH_RATES, style='sens_pct')  # C, D, E, F, G
+    write_column(ws, 82, 1, SENS_WACC_RATES, 'sens_pct')
+    set_cell(ws, 'A88', DATA_TABLE_NOTE, 'note')
+    set_cell(ws, 'A89', 'Row input: C38 (Growth Rate), Column input: C32 (WACC)', 'note')
+
+    # 2-way table: WACC vs Exit Multiple
+    set_cell(ws, 'A92', 'Equity Value per Share Sensitivity (Exit Multiple Method)', 'bold')
+    set_cell(ws, 'A93', 'WACC / Exit Multiple', 'bold')
+    write_row(ws, 93, 3, SENS_EXIT_MULTIPLES, style='sens_mult')
+    write_column(ws, 94, 1, SENS_WACC_RATES, 'sens_pct')
+    set_cell(ws, 'A100', DATA_TABLE_NOTE, 'note')
+    set_cell(ws, 'A101', 'Row input: C43 (Exit Multiple), Column input: C32 (WACC)', 'note')
+
+def add_valuation_outputs(wb):
+    """Write DCF outputs, checks and valuation assumptions into the existing sheets"""
+    print("  Adding valuation outputs to Summary, Checks and Assumptions & Drivers...")
+
+    for sheet_name, cells in VALUATION_CELLS.items():
+        ws = wb[sheet_name]
+        for addr, value, style, number_format in cells:
+            set_cell(ws, addr, value, style, number_format)
+
+def add_dcf_valuation(wb):
+    """Add the DCF tab and valuation outputs to an already-built model workbook
+
+    Works on the in-memory workbook so callers holding a built model can
+    apply the valuation without a save/load round trip.
+    """
+    register_named_styles(wb, ENHANCE_STYLES + DCF_STYLES)
 
-    row = 51
-    ws[f'A{row}'] = 'Risk-Free Rate'
-    ws['B51'] = 0.045
-    ws['B51'].fill = INPUT_FILL
-    ws['B51'].font = INPUT_FONT
-    ws['B51'].number_format = '0.0%'
-
-    row = 52
-    ws[f'A{row}'] = 'Equity Risk Premium'
-    ws['B52'] = 0.065
-    ws['B52'].fill = INPUT_FILL
-    ws['B52'].font = INPUT_FONT
-    ws['B52'].number_format = '0.0%'
-
-    row = 53
-    ws[f'A{row}'] = 'Beta'
-    ws['B53'] = 1.2
-    ws['B53'].fill = INPUT_FILL
-    ws['B53'].font = INPUT_FONT
-    ws['B53'].number_format = '0.00'
-
-    row = 54
-    ws[f'A{row}'] = 'Target Debt %'
-    ws['B54'] = 0.30
-    ws['B54'].fill = INPUT_FILL
-    ws['B54'].font = INPUT_FONT
-    ws['B54'].number_format = '0.0%'
+    # Create DCF tab
+    create_dcf_tab(wb)
+    print("✓ Created DCF tab")
 
-    row = 55
-    ws[f'A{row}'] = 'Terminal Growth Rate'
-    ws['B55'] = 0.025
-    ws['B55'].fill = INPUT_FILL
-    ws['B55'].font = INPUT_FONT
-    ws['B55'].number_format = '0.0%'
-
-    row = 56
-    ws[f'A{row}'] = 'Exit EV/EBITDA Multiple'
-    ws['B56'] = 8.5
-    ws['B56'].fill = INPUT_FILL
-    ws['B56'].font = INPUT_FONT
-    ws['B56'].number_format = '0.0x'
+    # Valuation outputs on Summary, DCF checks, and valuation assumptions
+    add_valuation_outputs(wb)
+    print("✓ Enhanced Summary with valuation outputs")
+    print("✓ Enhanced Checks with DCF validation")
+    print("✓ Added valuation assumptions")
 
 def main():
     """Main enhancement function"""
@@ -713,27 +495,14 @@ def main():
     print("=" * 60)
 
     # Load existing workbook
-    wb = load_workbook("3_Statement_Financial_Model.xlsx")
+    filename = "3_Statement_Financial_Model.xlsx"
+    wb = load_workbook(filename)
     print("✓ Loaded existing model")
 
-    # Create DCF tab
-    create_dcf_tab(wb)
-    print("✓ Created DCF tab")
-
-    # Enhance Summary
-    enhance_summary_with_valuation(wb["Summary"])
-    print("✓ Enhanced Summary with valuation outputs")
-
-    # Enhance Checks
-    enhance_checks_with_dcf(wb["Checks"])
-    print("✓ Enhanced Checks with DCF validation")
-
-    # Add valuation assumptions
-    add_valuation_assumptions_section(wb["Assumptions & Drivers"])
-    print("✓ Added valuation assumptions")
+    add_dcf_valuation(wb)
 
-    # Save enhanced model
-    wb.save("3_Statement_Financial_Model.xlsx")
+    # Save enhanced model over its input (via a temp file, so a failed save keeps the original)
+    save_workbook(wb, filename)
     print("\n" + "=" * 60)
     print("✓ Complete IB-grade model with DCF saved!")
     print("\nDCF Features Added:")
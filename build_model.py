@@ -5,20 +5,27 @@ Creates an integrated Income Statement, Balance Sheet, and Cash Flow Statement
 with IB-standard drivers and formatting
 """
 
+import os
+
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
 from openpyxl.chart import LineChart, Reference
 from openpyxl.worksheet.datavalidation import DataValidation
+from openpyxl.workbook.defined_name import DefinedName
 
 # Color definitions
-INPUT_FILL = PatternFill(start_color="D6E4F5", end_color="D6E4F5", fill_type="solid")  # Light blue
-HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")  # Dark blue
-SECTION_FILL = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")  # Light gray
-FORMULA_FONT = Font(color="000000")  # Black
-INPUT_FONT = Font(color="0000FF", bold=True)  # Blue
-HEADER_FONT = Font(color="FFFFFF", bold=True)  # White
+INPUT_FILL = PatternFill(start_color="FFD6E4F5", end_color="FFD6E4F5", fill_type="solid")  # Light blue
+HEADER_FILL = PatternFill(start_color="FF4472C4", end_color="FF4472C4", fill_type="solid")  # Dark blue
+SECTION_FILL = PatternFill(start_color="FFE7E6E6", end_color="FFE7E6E6", fill_type="solid")  # Light gray
+FORMULA_FONT = Font(color="FF000000")  # Black
+INPUT_FONT = Font(color="FF0000FF", bold=True)  # Blue
+HEADER_FONT = Font(color="FFFFFFFF", bold=True)  # White
 BOLD_FONT = Font(bold=True)
+TITLE_FONT = Font(size=16, bold=True, color="FF4472C4")
+HEADING_FONT = Font(size=14, bold=True)
+UNITS_FONT = Font(italic=True)
+CENTER_ALIGN = Alignment(horizontal='center')
 
 # Border styles
 THIN_BORDER = Border(
@@ -28,6 +35,26 @@ THIN_BORDER = Border(
     bottom=Side(style='thin')
 )
 
+# Named styles (registered once per workbook, applied with cell.style = name)
+NAMED_STYLES = (
+    NamedStyle(name="header", font=HEADER_FONT, fill=HEADER_FILL),
+    NamedStyle(name="year_header", font=HEADER_FONT, fill=HEADER_FILL,
+               alignment=CENTER_ALIGN),
+    NamedStyle(name="table_header", font=BOLD_FONT, fill=HEADER_FILL),
+    NamedStyle(name="section", font=BOLD_FONT, fill=SECTION_FILL),
+    NamedStyle(name="bold", font=BOLD_FONT),
+    NamedStyle(name="num", number_format='#,##0.0'),
+    NamedStyle(name="pct", number_format='0.0%'),
+    NamedStyle(name="bold_num", font=BOLD_FONT, number_format='#,##0.0'),
+    NamedStyle(name="input", font=INPUT_FONT, fill=INPUT_FILL),
+    NamedStyle(name="input_num", font=INPUT_FONT, fill=INPUT_FILL, number_format='#,##0.0'),
+    NamedStyle(name="input_pct", font=INPUT_FONT, fill=INPUT_FILL, number_format='0.0%'),
+    NamedStyle(name="input_days", font=INPUT_FONT, fill=INPUT_FILL, number_format='0'),
+    NamedStyle(name="title", font=TITLE_FONT),
+    NamedStyle(name="heading", font=HEADING_FONT),
+    NamedStyle(name="units", font=UNITS_FONT),
+)
+
 # Years
 HISTORICAL_YEARS = [2021, 2022, 2023, 2024]
 FORECAST_YEARS = [2025, 2026, 2027, 2028, 2029]
@@ -36,6 +63,85 @@ ALL_YEARS = HISTORICAL_YEARS + FORECAST_YEARS
 # Scenarios
 SCENARIOS = ['Base', 'Upside', 'Downside']
 
+# Column letters by 1-based index (_COLS[2] == 'B'), precomputed for A-Z
+_COLS = ['', *map(get_column_letter, range(1, 27))]
+
+# Column widths shared by the assumptions and statement sheets (label, first year, then C-K)
+COLUMN_WIDTHS = {'A': 30, 'B': 15, **{col: 12 for col in _COLS[3:12]}}
+
+# Model year columns, B-J
+YEAR_COLS = tuple(_COLS[2:2 + len(ALL_YEARS)])
+
+# Sheet prefixes for cross-sheet references
+ASSUMPTIONS_REF = "'Assumptions & Drivers'!"
+INCOME_REF = "'Income Statement'!"
+BALANCE_REF = "'Balance Sheet'!"
+CASH_FLOW_REF = "'Cash Flow'!"
+
+# Selected scenario as 1/2/3 (Base/Upside/Downside), defined once as the workbook name SCEN_IDX;
+# any other B4 value falls back to 3 (Downside), as the nested IFs it replaces did
+SCENARIO_INDEX = "IFERROR(MATCH(%s$B$4,{%s},0),3)" % (
+    ASSUMPTIONS_REF, ','.join(f'"{s}"' for s in SCENARIOS))
+
+# Scenario-driven forecast drivers: CHOOSE(SCEN_IDX, base, upside, downside)
+PRODUCT_GROWTH_2025 = '=CHOOSE(SCEN_IDX,0.08,0.12,0.05)'
+PRODUCT_GROWTH = '=CHOOSE(SCEN_IDX,0.06,0.10,0.03)'
+SERVICE_GROWTH_2025 = '=CHOOSE(SCEN_IDX,0.10,0.15,0.07)'
+SERVICE_GROWTH = '=CHOOSE(SCEN_IDX,0.08,0.12,0.05)'
+GROSS_MARGIN_FORECAST = '=CHOOSE(SCEN_IDX,0.67,0.70,0.64)'
+SGA_PCT_FORECAST = '=CHOOSE(SCEN_IDX,0.24,0.23,0.26)'
+RND_PCT_FORECAST = '=CHOOSE(SCEN_IDX,0.12,0.13,0.10)'
+CAPEX_PCT_FORECAST = '=CHOOSE(SCEN_IDX,0.07,0.09,0.06)'
+
+# Assumptions sheet inputs: (section, ((label, values, named style, first column), ...))
+# Rows with a forecast-only driver start at the first forecast column (F).
+_HIST = len(HISTORICAL_YEARS)
+_FCST = len(FORECAST_YEARS)
+_FIRST_FORECAST_COL = 2 + _HIST
+ASSUMPTIONS_TABLE = (
+    ('REVENUE ASSUMPTIONS', (
+        ('Product Revenue', (100, 110, 125, 140), 'input_num', 2),
+        ('Service Revenue', (50, 55, 62, 70), 'input_num', 2),
+        ('Product Revenue Growth %', (PRODUCT_GROWTH_2025,) + (PRODUCT_GROWTH,) * (_FCST - 1),
+         'input_pct', _FIRST_FORECAST_COL),
+        ('Service Revenue Growth %', (SERVICE_GROWTH_2025,) + (SERVICE_GROWTH,) * (_FCST - 1),
+         'input_pct', _FIRST_FORECAST_COL),
+    )),
+    ('OPERATING ASSUMPTIONS', (
+        ('Gross Margin %', (0.65,) * _HIST + (GROSS_MARGIN_FORECAST,) * _FCST, 'input_pct', 2),
+        ('SG&A % of Revenue', (0.25,) * _HIST + (SGA_PCT_FORECAST,) * _FCST, 'input_pct', 2),
+        ('R&D % of Revenue', (0.12,) * _HIST + (RND_PCT_FORECAST,) * _FCST, 'input_pct', 2),
+        ('D&A % of Revenue', (0.05,) * len(ALL_YEARS), 'input_pct', 2),
+        ('Tax Rate', (0.25,) * len(ALL_YEARS), 'input_pct', 2),
+    )),
+    ('BALANCE SHEET ASSUMPTIONS', (
+        ('AR Days', (45,) * len(ALL_YEARS), 'input_days', 2),
+        ('Inventory Days', (60,) * len(ALL_YEARS), 'input_days', 2),
+        ('AP Days', (30,) * len(ALL_YEARS), 'input_days', 2),
+        ('Other Current Assets % of Rev', (0.03,) * len(ALL_YEARS), 'input_pct', 2),
+        ('Other Current Liab % of Rev', (0.02,) * len(ALL_YEARS), 'input_pct', 2),
+        ('CapEx % of Revenue', (0.08,) * _HIST + (CAPEX_PCT_FORECAST,) * _FCST, 'input_pct', 2),
+    )),
+    ('DEBT ASSUMPTIONS', (
+        ('Beginning Debt (2021)', (50,), 'input_num', 2),
+        ('Revolver Interest Rate', (0.05,) * len(ALL_YEARS), 'input_pct', 2),
+        ('Beginning Equity (2021)', (200,), 'input_num', 2),
+        ('Beginning Cash (2021)', (30,), 'input_num', 2),
+        ('Beginning PP&E (2021)', (80,), 'input_num', 2),
+    )),
+)
+
+# Cash flow working capital lines: (label, Balance Sheet row, formula template)
+_ASSET_CHANGE = "=-(" + BALANCE_REF + "{col}{row}-" + BALANCE_REF + "{prev}{row})"
+_LIABILITY_CHANGE = "=" + BALANCE_REF + "{col}{row}-" + BALANCE_REF + "{prev}{row}"
+WORKING_CAPITAL_CHANGES = (
+    ('Change in AR', 8, _ASSET_CHANGE),
+    ('Change in Inventory', 9, _ASSET_CHANGE),
+    ('Change in Other Current Assets', 10, _ASSET_CHANGE),
+    ('Change in AP', 19, _LIABILITY_CHANGE),
+    ('Change in Other Current Liab', 20, _LIABILITY_CHANGE),
+)
+
 def create_workbook():
     """Create and return a new workbook with all sheets"""
     wb = Workbook()
@@ -48,8 +154,41 @@ def create_workbook():
     wb.create_sheet("Cash Flow", 3)
     wb.create_sheet("Charts", 4)
 
+    register_named_styles(wb)
+
     return wb
 
+def register_named_styles(wb, extra=()):
+    """Register the shared named styles, then any extra ones, skipping names the workbook already has"""
+    for style in NAMED_STYLES + tuple(extra):
+        if style.name not in wb.named_styles:
+            wb.add_named_style(style)
+
+def save_workbook(wb, filename):
+    """Save to a temporary file next to filename and swap it in
+
+    A failed save never leaves a truncated model behind, nor a stray temp file.
+    """
+    tmp_filename = filename + ".tmp"
+    try:
+        wb.save(tmp_filename)
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        raise
+
+def define_scenario_index(wb):
+    """Define the workbook name SCEN_IDX (selected scenario as 1/2/3) unless it already exists"""
+    if 'SCEN_IDX' in wb.defined_names:
+        return
+    name = DefinedName('SCEN_IDX', attr_text=SCENARIO_INDEX)
+    # openpyxl 3.1 keys defined names by name; 3.0 keeps them in a list
+    if hasattr(wb.defined_names, 'add'):
+        wb.defined_names.add(name)
+    else:
+        wb.defined_names.append(name)
+
 def set_column_widths(ws, widths):
     """Set column widths for a worksheet"""
     for col, width in widths.items():
@@ -68,1009 +207,479 @@ def apply_cell_style(cell, font=None, fill=None, alignment=None, border=None, nu
     if number_format:
         cell.number_format = number_format
 
+def write_cell(ws, row, col, value, style=None, **formatting):
+    """Write a value to the cell at (row, col), apply a named style, then any extra formatting"""
+    cell = ws.cell(row=row, column=col, value=value)
+    if style is not None:
+        cell.style = style
+    apply_cell_style(cell, **formatting)
+    return cell
+
+def write_year_row(ws, row, label, formula, style='num', label_style=None):
+    """Write a labelled row across all model years
+
+    formula(i, col, prev_col) returns the value for year index i, where col is
+    that year's column letter and prev_col the prior year's (None for 2021).
+    """
+    write_cell(ws, row, 1, label, style=label_style)
+    prev_col = None
+    for i, col in enumerate(YEAR_COLS):
+        write_cell(ws, row, 2 + i, formula(i, col, prev_col), style=style)  # Column B onwards
+        prev_col = col
+
+def write_input_row(ws, row, label, values, style, col_start=2):
+    """Write a labelled row of input values from col_start (column B), all in one named style"""
+    ws.cell(row=row, column=1, value=label)
+    for col, value in enumerate(values, col_start):
+        write_cell(ws, row, col, value, style=style)
+
 def build_assumptions_sheet(wb):
     """Build the Assumptions & Drivers sheet"""
     ws = wb["Assumptions & Drivers"]
 
     # Set column widths
-    set_column_widths(ws, {
-        'A': 30, 'B': 15, 'C': 12, 'D': 12, 'E': 12, 'F': 12,
-        'G': 12, 'H': 12, 'I': 12, 'J': 12, 'K': 12
-    })
+    set_column_widths(ws, COLUMN_WIDTHS)
 
     # Title
-    ws['A1'] = '3-STATEMENT FINANCIAL MODEL'
-    ws['A1'].font = Font(size=16, bold=True, color="4472C4")
+    write_cell(ws, 1, 1, '3-STATEMENT FINANCIAL MODEL', style='title')
 
-    ws['A2'] = 'ASSUMPTIONS & DRIVERS'
-    ws['A2'].font = Font(size=14, bold=True)
+    write_cell(ws, 2, 1, 'ASSUMPTIONS & DRIVERS', style='heading')
 
     # Scenario selector
-    ws['A4'] = 'Scenario Selection:'
-    ws['A4'].font = BOLD_FONT
-    ws['B4'] = 'Base'
-    ws['B4'].fill = INPUT_FILL
-    ws['B4'].font = INPUT_FONT
+    write_cell(ws, 4, 1, 'Scenario Selection:', style='bold')
+    write_cell(ws, 4, 2, 'Base', style='input')
 
     # Add data validation for scenario dropdown
     dv = DataValidation(type="list", formula1='"Base,Upside,Downside"', allow_blank=False)
-    dv.add(ws['B4'])
+    dv.add('B4')
     ws.add_data_validation(dv)
+    define_scenario_index(wb)
 
     # Years header
     row = 6
-    ws[f'A{row}'] = 'INPUTS (in $mm)'
-    ws[f'A{row}'].font = HEADER_FONT
-    ws[f'A{row}'].fill = HEADER_FILL
+    write_cell(ws, row, 1, 'INPUTS (in $mm)', style='header')
 
     # Year headers
     col_start = 2  # Column B
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = year
-        ws[f'{col}{row}'].font = HEADER_FONT
-        ws[f'{col}{row}'].fill = HEADER_FILL
-        ws[f'{col}{row}'].alignment = Alignment(horizontal='center')
-
-    # Revenue Assumptions
-    row += 1
-    ws[f'A{row}'] = 'REVENUE ASSUMPTIONS'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
-
-    # Product Revenue
-    row += 1
-    ws[f'A{row}'] = 'Product Revenue'
-    ws['B' + str(row)] = 100
-    ws['C' + str(row)] = 110
-    ws['D' + str(row)] = 125
-    ws['E' + str(row)] = 140
-    for col in ['B', 'C', 'D', 'E']:
-        ws[col + str(row)].fill = INPUT_FILL
-        ws[col + str(row)].font = INPUT_FONT
-        ws[col + str(row)].number_format = '#,##0.0'
-
-    # Service Revenue
-    row += 1
-    ws[f'A{row}'] = 'Service Revenue'
-    ws['B' + str(row)] = 50
-    ws['C' + str(row)] = 55
-    ws['D' + str(row)] = 62
-    ws['E' + str(row)] = 70
-    for col in ['B', 'C', 'D', 'E']:
-        ws[col + str(row)].fill = INPUT_FILL
-        ws[col + str(row)].font = INPUT_FONT
-        ws[col + str(row)].number_format = '#,##0.0'
-
-    # Product Revenue Growth %
-    row += 1
-    ws[f'A{row}'] = 'Product Revenue Growth %'
-    for i, col_letter in enumerate([get_column_letter(col_start + 4 + i) for i in range(5)]):
-        if col_letter == 'F':  # 2025
-            ws[f'{col_letter}{row}'] = '=IF($B$4="Base",0.08,IF($B$4="Upside",0.12,0.05))'
-        else:
-            ws[f'{col_letter}{row}'] = '=IF($B$4="Base",0.06,IF($B$4="Upside",0.10,0.03))'
-        ws[f'{col_letter}{row}'].fill = INPUT_FILL
-        ws[f'{col_letter}{row}'].font = INPUT_FONT
-        ws[f'{col_letter}{row}'].number_format = '0.0%'
-
-    # Service Revenue Growth %
-    row += 1
-    ws[f'A{row}'] = 'Service Revenue Growth %'
-    for i, col_letter in enumerate([get_column_letter(col_start + 4 + i) for i in range(5)]):
-        if col_letter == 'F':  # 2025
-            ws[f'{col_letter}{row}'] = '=IF($B$4="Base",0.10,IF($B$4="Upside",0.15,0.07))'
-        else:
-            ws[f'{col_letter}{row}'] = '=IF($B$4="Base",0.08,IF($B$4="Upside",0.12,0.05))'
-        ws[f'{col_letter}{row}'].fill = INPUT_FILL
-        ws[f'{col_letter}{row}'].font = INPUT_FONT
-        ws[f'{col_letter}{row}'].number_format = '0.0%'
-
-    # Operating Assumptions
-    row += 2
-    ws[f'A{row}'] = 'OPERATING ASSUMPTIONS'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
-
-    # Gross Margin %
-    row += 1
-    ws[f'A{row}'] = 'Gross Margin %'
-    for i, col_letter in enumerate([get_column_letter(col_start + i) for i in range(len(ALL_YEARS))]):
-        if i < 4:  # Historical
-            ws[f'{col_letter}{row}'] = 0.65
-        else:  # Forecast
-            ws[f'{col_letter}{row}'] = '=IF($B$4="Base",0.67,IF($B$4="Upside",0.70,0.64))'
-        ws[f'{col_letter}{row}'].fill = INPUT_FILL
-        ws[f'{col_letter}{row}'].font = INPUT_FONT
-        ws[f'{col_letter}{row}'].number_format = '0.0%'
-
-    # SG&A % of Revenue
-    row += 1
-    ws[f'A{row}'] = 'SG&A % of Revenue'
-    for i, col_letter in enumerate([get_column_letter(col_start + i) for i in range(len(ALL_YEARS))]):
-        if i < 4:  # Historical
-            ws[f'{col_letter}{row}'] = 0.25
-        else:  # Forecast
-            ws[f'{col_letter}{row}'] = '=IF($B$4="Base",0.24,IF($B$4="Upside",0.23,0.26))'
-        ws[f'{col_letter}{row}'].fill = INPUT_FILL
-        ws[f'{col_letter}{row}'].font = INPUT_FONT
-        ws[f'{col_letter}{row}'].number_format = '0.0%'
-
-    # R&D % of Revenue
-    row += 1
-    ws[f'A{row}'] = 'R&D % of Revenue'
-    for i, col_letter in enumerate([get_column_letter(col_start + i) for i in range(len(ALL_YEARS))]):
-        if i < 4:  # Historical
-            ws[f'{col_letter}{row}'] = 0.12
-        else:  # Forecast
-            ws[f'{col_letter}{row}'] = '=IF($B$4="Base",0.12,IF($B$4="Upside",0.13,0.10))'
-        ws[f'{col_letter}{row}'].fill = INPUT_FILL
-        ws[f'{col_letter}{row}'].font = INPUT_FONT
-        ws[f'{col_letter}{row}'].number_format = '0.0%'
-
-    # D&A % of Revenue
-    row += 1
-    ws[f'A{row}'] = 'D&A % of Revenue'
-    for i, col_letter in enumerate([get_column_letter(col_start + i) for i in range(len(ALL_YEARS))]):
-        ws[f'{col_letter}{row}'] = 0.05
-        ws[f'{col_letter}{row}'].fill = INPUT_FILL
-        ws[f'{col_letter}{row}'].font = INPUT_FONT
-        ws[f'{col_letter}{row}'].number_format = '0.0%'
-
-    # Tax Rate
-    row += 1
-    ws[f'A{row}'] = 'Tax Rate'
-    for i, col_letter in enumerate([get_column_letter(col_start + i) for i in range(len(ALL_YEARS))]):
-        ws[f'{col_letter}{row}'] = 0.25
-        ws[f'{col_letter}{row}'].fill = INPUT_FILL
-        ws[f'{col_letter}{row}'].font = INPUT_FONT
-        ws[f'{col_letter}{row}'].number_format = '0.0%'
-
-    # Balance Sheet Assumptions
-    row += 2
-    ws[f'A{row}'] = 'BALANCE SHEET ASSUMPTIONS'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
-
-    # AR Days
-    row += 1
-    ws[f'A{row}'] = 'AR Days'
-    for i, col_letter in enumerate([get_column_letter(col_start + i) for i in range(len(ALL_YEARS))]):
-        ws[f'{col_letter}{row}'] = 45
-        ws[f'{col_letter}{row}'].fill = INPUT_FILL
-        ws[f'{col_letter}{row}'].font = INPUT_FONT
-        ws[f'{col_letter}{row}'].number_format = '0'
-
-    # Inventory Days
-    row += 1
-    ws[f'A{row}'] = 'Inventory Days'
-    for i, col_letter in enumerate([get_column_letter(col_start + i) for i in range(len(ALL_YEARS))]):
-        ws[f'{col_letter}{row}'] = 60
-        ws[f'{col_letter}{row}'].fill = INPUT_FILL
-        ws[f'{col_letter}{row}'].font = INPUT_FONT
-        ws[f'{col_letter}{row}'].number_format = '0'
-
-    # AP Days
-    row += 1
-    ws[f'A{row}'] = 'AP Days'
-    for i, col_letter in enumerate([get_column_letter(col_start + i) for i in range(len(ALL_YEARS))]):
-        ws[f'{col_letter}{row}'] = 30
-        ws[f'{col_letter}{row}'].fill = INPUT_FILL
-        ws[f'{col_letter}{row}'].font = INPUT_FONT
-        ws[f'{col_letter}{row}'].number_format = '0'
-
-    # Other Current Assets % of Revenue
-    row += 1
-    ws[f'A{row}'] = 'Other Current Assets % of Rev'
-    for i, col_letter in enumerate([get_column_letter(col_start + i) for i in range(len(ALL_YEARS))]):
-        ws[f'{col_letter}{row}'] = 0.03
-        ws[f'{col_letter}{row}'].fill = INPUT_FILL
-        ws[f'{col_letter}{row}'].font = INPUT_FONT
-        ws[f'{col_letter}{row}'].number_format = '0.0%'
-
-    # Other Current Liabilities % of Revenue
-    row += 1
-    ws[f'A{row}'] = 'Other Current Liab % of Rev'
-    for i, col_letter in enumerate([get_column_letter(col_start + i) for i in range(len(ALL_YEARS))]):
-        ws[f'{col_letter}{row}'] = 0.02
-        ws[f'{col_letter}{row}'].fill = INPUT_FILL
-        ws[f'{col_letter}{row}'].font = INPUT_FONT
-        ws[f'{col_letter}{row}'].number_format = '0.0%'
-
-    # CapEx % of Revenue
-    row += 1
-    ws[f'A{row}'] = 'CapEx % of Revenue'
-    for i, col_letter in enumerate([get_column_letter(col_start + i) for i in range(len(ALL_YEARS))]):
-        if i < 4:  # Historical
-            ws[f'{col_letter}{row}'] = 0.08
-        else:  # Forecast
-            ws[f'{col_letter}{row}'] = '=IF($B$4="Base",0.07,IF($B$4="Upside",0.09,0.06))'
-        ws[f'{col_letter}{row}'].fill = INPUT_FILL
-        ws[f'{col_letter}{row}'].font = INPUT_FONT
-        ws[f'{col_letter}{row}'].number_format = '0.0%'
-
-    # Debt Assumptions
-    row += 2
-    ws[f'A{row}'] = 'DEBT ASSUMPTIONS'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
-
-    # Beginning Debt
-    row += 1
-    ws[f'A{row}'] = 'Beginning Debt (2021)'
-    ws['B' + str(row)] = 50
-    ws['B' + str(row)].fill = INPUT_FILL
-    ws['B' + str(row)].font = INPUT_FONT
-    ws['B' + str(row)].number_format = '#,##0.0'
+    for col, year in enumerate(ALL_YEARS, col_start):
+        write_cell(ws, row, col, year, style='year_header')
 
-    # Revolver Interest Rate
-    row += 1
-    ws[f'A{row}'] = 'Revolver Interest Rate'
-    for i, col_letter in enumerate([get_column_letter(col_start + i) for i in range(len(ALL_YEARS))]):
-        ws[f'{col_letter}{row}'] = 0.05
-        ws[f'{col_letter}{row}'].fill = INPUT_FILL
-        ws[f'{col_letter}{row}'].font = INPUT_FONT
-        ws[f'{col_letter}{row}'].number_format = '0.0%'
-
-    # Beginning Equity
+    # Input rows, one section at a time with a blank row between sections
     row += 1
-    ws[f'A{row}'] = 'Beginning Equity (2021)'
-    ws['B' + str(row)] = 200
-    ws['B' + str(row)].fill = INPUT_FILL
-    ws['B' + str(row)].font = INPUT_FONT
-    ws['B' + str(row)].number_format = '#,##0.0'
-
-    # Beginning Cash
-    row += 1
-    ws[f'A{row}'] = 'Beginning Cash (2021)'
-    ws['B' + str(row)] = 30
-    ws['B' + str(row)].fill = INPUT_FILL
-    ws['B' + str(row)].font = INPUT_FONT
-    ws['B' + str(row)].number_format = '#,##0.0'
-
-    # Beginning PP&E
-    row += 1
-    ws[f'A{row}'] = 'Beginning PP&E (2021)'
-    ws['B' + str(row)] = 80
-    ws['B' + str(row)].fill = INPUT_FILL
-    ws['B' + str(row)].font = INPUT_FONT
-    ws['B' + str(row)].number_format = '#,##0.0'
+    for section, rows in ASSUMPTIONS_TABLE:
+        write_cell(ws, row, 1, section, style='section')
+        for label, values, style, first_col in rows:
+            row += 1
+            write_input_row(ws, row, label, values, style, col_start=first_col)
+        row += 2
 
 def build_income_statement(wb):
     """Build the Income Statement"""
     ws = wb["Income Statement"]
 
     # Set column widths
-    set_column_widths(ws, {
-        'A': 30, 'B': 15, 'C': 12, 'D': 12, 'E': 12, 'F': 12,
-        'G': 12, 'H': 12, 'I': 12, 'J': 12, 'K': 12
-    })
+    set_column_widths(ws, COLUMN_WIDTHS)
 
     # Title
-    ws['A1'] = 'INCOME STATEMENT'
-    ws['A1'].font = Font(size=14, bold=True)
+    write_cell(ws, 1, 1, 'INCOME STATEMENT', style='heading')
 
-    ws['A2'] = '($ in millions)'
-    ws['A2'].font = Font(italic=True)
+    write_cell(ws, 2, 1, '($ in millions)', style='units')
 
     # Years header
     row = 4
-    ws[f'A{row}'] = 'Period'
-    ws[f'A{row}'].font = BOLD_FONT
+    write_cell(ws, row, 1, 'Period', style='bold')
 
     col_start = 2  # Column B
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = year
-        ws[f'{col}{row}'].font = HEADER_FONT
-        ws[f'{col}{row}'].fill = HEADER_FILL
-        ws[f'{col}{row}'].alignment = Alignment(horizontal='center')
+    for col, year in enumerate(ALL_YEARS, col_start):
+        write_cell(ws, row, col, year, style='year_header')
 
     # Revenue section
     row += 1
-    ws[f'A{row}'] = 'Revenue'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
+    write_cell(ws, row, 1, 'Revenue', style='section')
 
-    # Product Revenue
+    # Product Revenue - historical links to assumptions, forecast grows from prior year
     row += 1
     prod_rev_row = row
-    ws[f'A{row}'] = 'Product Revenue'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(col_start + i)
-
-        if i < 4:  # Historical - link to assumptions
-            ws[f'{col}{row}'] = f"='Assumptions & Drivers'!{year_col}8"
-        else:  # Forecast - calculate from growth rate
-            prev_col = get_column_letter(col_start + i - 1)
-            ws[f'{col}{row}'] = f"={prev_col}{row}*(1+'Assumptions & Drivers'!{year_col}10)"
-
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'Product Revenue', lambda i, col, prev_col: (
+        f"={ASSUMPTIONS_REF}{col}8" if i < _HIST
+        else f"={prev_col}{prod_rev_row}*(1+{ASSUMPTIONS_REF}{col}10)"))
 
     # Service Revenue
     row += 1
     svc_rev_row = row
-    ws[f'A{row}'] = 'Service Revenue'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(col_start + i)
-
-        if i < 4:  # Historical - link to assumptions
-            ws[f'{col}{row}'] = f"='Assumptions & Drivers'!{year_col}9"
-        else:  # Forecast - calculate from growth rate
-            prev_col = get_column_letter(col_start + i - 1)
-            ws[f'{col}{row}'] = f"={prev_col}{row}*(1+'Assumptions & Drivers'!{year_col}11)"
-
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'Service Revenue', lambda i, col, prev_col: (
+        f"={ASSUMPTIONS_REF}{col}9" if i < _HIST
+        else f"={prev_col}{svc_rev_row}*(1+{ASSUMPTIONS_REF}{col}11)"))
 
     # Total Revenue
     row += 1
     total_rev_row = row
-    ws[f'A{row}'] = 'Total Revenue'
-    ws[f'A{row}'].font = BOLD_FONT
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"=SUM({col}{prod_rev_row}:{col}{svc_rev_row})"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
+    write_year_row(ws, row, 'Total Revenue',
+                   lambda i, col, prev_col: f"=SUM({col}{prod_rev_row}:{col}{svc_rev_row})",
+                   style='bold_num', label_style='bold')
 
     # COGS
     row += 1
-    ws[f'A{row}'] = 'Cost of Goods Sold'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{total_rev_row}*(1-'Assumptions & Drivers'!{year_col}14)"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    cogs_row = row
+    write_year_row(ws, row, 'Cost of Goods Sold',
+                   lambda i, col, prev_col: f"={col}{total_rev_row}*(1-{ASSUMPTIONS_REF}{col}14)")
 
     # Gross Profit
     row += 1
     gross_profit_row = row
-    ws[f'A{row}'] = 'Gross Profit'
-    ws[f'A{row}'].font = BOLD_FONT
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{total_rev_row}-{col}{row-1}"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
+    write_year_row(ws, row, 'Gross Profit',
+                   lambda i, col, prev_col: f"={col}{total_rev_row}-{col}{cogs_row}",
+                   style='bold_num', label_style='bold')
 
     # Operating Expenses
     row += 1
-    ws[f'A{row}'] = 'Operating Expenses'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
+    write_cell(ws, row, 1, 'Operating Expenses', style='section')
 
     # SG&A
     row += 1
     sga_row = row
-    ws[f'A{row}'] = 'SG&A'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{total_rev_row}*'Assumptions & Drivers'!{year_col}15"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'SG&A',
+                   lambda i, col, prev_col: f"={col}{total_rev_row}*{ASSUMPTIONS_REF}{col}15")
 
     # R&D
     row += 1
-    rnd_row = row
-    ws[f'A{row}'] = 'R&D'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{total_rev_row}*'Assumptions & Drivers'!{year_col}16"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'R&D',
+                   lambda i, col, prev_col: f"={col}{total_rev_row}*{ASSUMPTIONS_REF}{col}16")
 
     # D&A
     row += 1
     da_row = row
-    ws[f'A{row}'] = 'D&A'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{total_rev_row}*'Assumptions & Drivers'!{year_col}17"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'D&A',
+                   lambda i, col, prev_col: f"={col}{total_rev_row}*{ASSUMPTIONS_REF}{col}17")
 
     # Total Operating Expenses
     row += 1
     total_opex_row = row
-    ws[f'A{row}'] = 'Total Operating Expenses'
-    ws[f'A{row}'].font = BOLD_FONT
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"=SUM({col}{sga_row}:{col}{da_row})"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
+    write_year_row(ws, row, 'Total Operating Expenses',
+                   lambda i, col, prev_col: f"=SUM({col}{sga_row}:{col}{da_row})",
+                   style='bold_num', label_style='bold')
 
     # EBIT
     row += 1
     ebit_row = row
-    ws[f'A{row}'] = 'EBIT'
-    ws[f'A{row}'].font = BOLD_FONT
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{gross_profit_row}-{col}{total_opex_row}"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
-
-    # Interest Expense
+    write_year_row(ws, row, 'EBIT',
+                   lambda i, col, prev_col: f"={col}{gross_profit_row}-{col}{total_opex_row}",
+                   style='bold_num', label_style='bold')
+
+    # Interest Expense - will link to BS debt * interest rate
     row += 1
     interest_row = row
-    ws[f'A{row}'] = 'Interest Expense'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(col_start + i)
-        # Will link to BS debt * interest rate
-        ws[f'{col}{row}'] = f"='Balance Sheet'!{col}26*'Assumptions & Drivers'!{year_col}31"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'Interest Expense',
+                   lambda i, col, prev_col: f"={BALANCE_REF}{col}26*{ASSUMPTIONS_REF}{col}31")
 
     # EBT
     row += 1
     ebt_row = row
-    ws[f'A{row}'] = 'EBT'
-    ws[f'A{row}'].font = BOLD_FONT
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{ebit_row}-{col}{interest_row}"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
+    write_year_row(ws, row, 'EBT',
+                   lambda i, col, prev_col: f"={col}{ebit_row}-{col}{interest_row}",
+                   style='bold_num', label_style='bold')
 
     # Taxes
     row += 1
     tax_row = row
-    ws[f'A{row}'] = 'Taxes'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{ebt_row}*'Assumptions & Drivers'!{year_col}18"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'Taxes',
+                   lambda i, col, prev_col: f"={col}{ebt_row}*{ASSUMPTIONS_REF}{col}18")
 
     # Net Income
     row += 1
     ni_row = row
-    ws[f'A{row}'] = 'Net Income'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{ebt_row}-{col}{tax_row}"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
+    write_year_row(ws, row, 'Net Income',
+                   lambda i, col, prev_col: f"={col}{ebt_row}-{col}{tax_row}",
+                   style='bold_num', label_style='section')
 
     # Key metrics
     row += 2
-    ws[f'A{row}'] = 'KEY METRICS'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
+    write_cell(ws, row, 1, 'KEY METRICS', style='section')
 
     # EBITDA
     row += 1
     ebitda_row = row
-    ws[f'A{row}'] = 'EBITDA'
-    ws[f'A{row}'].font = BOLD_FONT
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{ebit_row}+{col}{da_row}"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
+    write_year_row(ws, row, 'EBITDA',
+                   lambda i, col, prev_col: f"={col}{ebit_row}+{col}{da_row}",
+                   style='bold_num', label_style='bold')
 
     # EBITDA Margin
     row += 1
-    ws[f'A{row}'] = 'EBITDA Margin'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{ebitda_row}/{col}{total_rev_row}"
-        ws[f'{col}{row}'].number_format = '0.0%'
+    write_year_row(ws, row, 'EBITDA Margin',
+                   lambda i, col, prev_col: f"={col}{ebitda_row}/{col}{total_rev_row}",
+                   style='pct')
 
     # Net Income Margin
     row += 1
-    ws[f'A{row}'] = 'Net Income Margin'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{ni_row}/{col}{total_rev_row}"
-        ws[f'{col}{row}'].number_format = '0.0%'
+    write_year_row(ws, row, 'Net Income Margin',
+                   lambda i, col, prev_col: f"={col}{ni_row}/{col}{total_rev_row}",
+                   style='pct')
 
 def build_balance_sheet(wb):
     """Build the Balance Sheet"""
     ws = wb["Balance Sheet"]
 
     # Set column widths
-    set_column_widths(ws, {
-        'A': 30, 'B': 15, 'C': 12, 'D': 12, 'E': 12, 'F': 12,
-        'G': 12, 'H': 12, 'I': 12, 'J': 12, 'K': 12
-    })
+    set_column_widths(ws, COLUMN_WIDTHS)
 
     # Title
-    ws['A1'] = 'BALANCE SHEET'
-    ws['A1'].font = Font(size=14, bold=True)
+    write_cell(ws, 1, 1, 'BALANCE SHEET', style='heading')
 
-    ws['A2'] = '($ in millions)'
-    ws['A2'].font = Font(italic=True)
+    write_cell(ws, 2, 1, '($ in millions)', style='units')
 
     # Years header
     row = 4
-    ws[f'A{row}'] = 'Period Ending'
-    ws[f'A{row}'].font = BOLD_FONT
+    write_cell(ws, row, 1, 'Period Ending', style='bold')
 
     col_start = 2  # Column B
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = year
-        ws[f'{col}{row}'].font = HEADER_FONT
-        ws[f'{col}{row}'].fill = HEADER_FILL
-        ws[f'{col}{row}'].alignment = Alignment(horizontal='center')
+    for col, year in enumerate(ALL_YEARS, col_start):
+        write_cell(ws, row, col, year, style='year_header')
 
     # ASSETS
     row += 1
-    ws[f'A{row}'] = 'ASSETS'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
+    write_cell(ws, row, 1, 'ASSETS', style='section')
 
     # Current Assets
     row += 1
-    ws[f'A{row}'] = 'Current Assets'
-    ws[f'A{row}'].font = BOLD_FONT
+    write_cell(ws, row, 1, 'Current Assets', style='bold')
 
-    # Cash
+    # Cash - opening balance from assumptions, then CF ending cash
     row += 1
     cash_row = row
-    ws[f'A{row}'] = 'Cash'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        if i == 0:  # 2021
-            ws[f'{col}{row}'] = "='Assumptions & Drivers'!B33"
-        else:
-            # Link to CF ending cash
-            ws[f'{col}{row}'] = f"='Cash Flow'!{col}32"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-
-    # Accounts Receivable
+    write_year_row(ws, row, 'Cash', lambda i, col, prev_col: (
+        f"={ASSUMPTIONS_REF}B33" if i == 0 else f"={CASH_FLOW_REF}{col}32"))
+
+    # Accounts Receivable = Revenue * AR Days / 365
     row += 1
-    ar_row = row
-    ws[f'A{row}'] = 'Accounts Receivable'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(col_start + i)
-        # AR = Revenue * AR Days / 365
-        ws[f'{col}{row}'] = f"='Income Statement'!{col}7*'Assumptions & Drivers'!{year_col}21/365"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-
-    # Inventory
+    write_year_row(ws, row, 'Accounts Receivable', lambda i, col, prev_col: (
+        f"={INCOME_REF}{col}7*{ASSUMPTIONS_REF}{col}21/365"))
+
+    # Inventory = COGS * Inventory Days / 365
     row += 1
-    inv_row = row
-    ws[f'A{row}'] = 'Inventory'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(col_start + i)
-        # Inventory = COGS * Inventory Days / 365
-        ws[f'{col}{row}'] = f"='Income Statement'!{col}8*'Assumptions & Drivers'!{year_col}22/365"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'Inventory', lambda i, col, prev_col: (
+        f"={INCOME_REF}{col}8*{ASSUMPTIONS_REF}{col}22/365"))
 
     # Other Current Assets
     row += 1
     other_ca_row = row
-    ws[f'A{row}'] = 'Other Current Assets'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"='Income Statement'!{col}7*'Assumptions & Drivers'!{year_col}24"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'Other Current Assets', lambda i, col, prev_col: (
+        f"={INCOME_REF}{col}7*{ASSUMPTIONS_REF}{col}24"))
 
     # Total Current Assets
     row += 1
     total_ca_row = row
-    ws[f'A{row}'] = 'Total Current Assets'
-    ws[f'A{row}'].font = BOLD_FONT
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"=SUM({col}{cash_row}:{col}{other_ca_row})"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
-
-    # PP&E
+    write_year_row(ws, row, 'Total Current Assets',
+                   lambda i, col, prev_col: f"=SUM({col}{cash_row}:{col}{other_ca_row})",
+                   style='bold_num', label_style='bold')
+
+    # PP&E = Prior PP&E + CapEx - D&A
     row += 1
-    ws[f'A{row}'] = 'PP&E, Net'
     ppe_row = row
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(col_start + i)
-        if i == 0:  # 2021
-            ws[f'{col}{row}'] = "='Assumptions & Drivers'!B34"
-        else:
-            # PP&E = Prior PP&E + CapEx - D&A
-            prev_col = get_column_letter(col_start + i - 1)
-            ws[f'{col}{row}'] = f"={prev_col}{row}+'Cash Flow'!{col}18-'Income Statement'!{col}13"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'PP&E, Net', lambda i, col, prev_col: (
+        f"={ASSUMPTIONS_REF}B34" if i == 0
+        else f"={prev_col}{ppe_row}+{CASH_FLOW_REF}{col}18-{INCOME_REF}{col}13"))
 
     # Total Assets
     row += 1
     total_assets_row = row
-    ws[f'A{row}'] = 'Total Assets'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{total_ca_row}+{col}{ppe_row}"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
+    write_year_row(ws, row, 'Total Assets',
+                   lambda i, col, prev_col: f"={col}{total_ca_row}+{col}{ppe_row}",
+                   style='bold_num', label_style='section')
 
     # LIABILITIES & EQUITY
     row += 2
-    ws[f'A{row}'] = 'LIABILITIES & EQUITY'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
+    write_cell(ws, row, 1, 'LIABILITIES & EQUITY', style='section')
 
     # Current Liabilities
     row += 1
-    ws[f'A{row}'] = 'Current Liabilities'
-    ws[f'A{row}'].font = BOLD_FONT
+    write_cell(ws, row, 1, 'Current Liabilities', style='bold')
 
-    # Accounts Payable
+    # Accounts Payable = COGS * AP Days / 365
     row += 1
     ap_row = row
-    ws[f'A{row}'] = 'Accounts Payable'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(col_start + i)
-        # AP = COGS * AP Days / 365
-        ws[f'{col}{row}'] = f"='Income Statement'!{col}8*'Assumptions & Drivers'!{year_col}23/365"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'Accounts Payable', lambda i, col, prev_col: (
+        f"={INCOME_REF}{col}8*{ASSUMPTIONS_REF}{col}23/365"))
 
     # Other Current Liabilities
     row += 1
     other_cl_row = row
-    ws[f'A{row}'] = 'Other Current Liabilities'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"='Income Statement'!{col}7*'Assumptions & Drivers'!{year_col}25"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'Other Current Liabilities', lambda i, col, prev_col: (
+        f"={INCOME_REF}{col}7*{ASSUMPTIONS_REF}{col}25"))
 
     # Total Current Liabilities
     row += 1
     total_cl_row = row
-    ws[f'A{row}'] = 'Total Current Liabilities'
-    ws[f'A{row}'].font = BOLD_FONT
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"=SUM({col}{ap_row}:{col}{other_cl_row})"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
-
-    # Revolver / Debt
+    write_year_row(ws, row, 'Total Current Liabilities',
+                   lambda i, col, prev_col: f"=SUM({col}{ap_row}:{col}{other_cl_row})",
+                   style='bold_num', label_style='bold')
+
+    # Revolver / Debt - opening balance from assumptions, then linked from Cash Flow
     row += 1
     debt_row = row
-    ws[f'A{row}'] = 'Revolver / Debt'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        if i == 0:  # 2021
-            ws[f'{col}{row}'] = "='Assumptions & Drivers'!B30"
-        else:
-            # Link from Cash Flow
-            ws[f'{col}{row}'] = f"='Cash Flow'!{col}30"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'Revolver / Debt', lambda i, col, prev_col: (
+        f"={ASSUMPTIONS_REF}B30" if i == 0 else f"={CASH_FLOW_REF}{col}30"))
 
     # Total Liabilities
     row += 1
     total_liab_row = row
-    ws[f'A{row}'] = 'Total Liabilities'
-    ws[f'A{row}'].font = BOLD_FONT
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{total_cl_row}+{col}{debt_row}"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
-
-    # Shareholders' Equity
+    write_year_row(ws, row, 'Total Liabilities',
+                   lambda i, col, prev_col: f"={col}{total_cl_row}+{col}{debt_row}",
+                   style='bold_num', label_style='bold')
+
+    # Shareholders' Equity = Prior Equity + Net Income
     row += 1
     equity_row = row
-    ws[f'A{row}'] = "Shareholders' Equity"
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        if i == 0:  # 2021
-            ws[f'{col}{row}'] = "='Assumptions & Drivers'!B32"
-        else:
-            # Equity = Prior Equity + Net Income
-            prev_col = get_column_letter(col_start + i - 1)
-            ws[f'{col}{row}'] = f"={prev_col}{row}+'Income Statement'!{col}19"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, "Shareholders' Equity", lambda i, col, prev_col: (
+        f"={ASSUMPTIONS_REF}B32" if i == 0
+        else f"={prev_col}{equity_row}+{INCOME_REF}{col}19"))
 
     # Total Liabilities & Equity
     row += 1
     total_liab_eq_row = row
-    ws[f'A{row}'] = 'Total Liabilities & Equity'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{total_liab_row}+{col}{equity_row}"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
+    write_year_row(ws, row, 'Total Liabilities & Equity',
+                   lambda i, col, prev_col: f"={col}{total_liab_row}+{col}{equity_row}",
+                   style='bold_num', label_style='section')
 
     # Balance Check
     row += 2
-    ws[f'A{row}'] = 'Balance Check'
-    ws[f'A{row}'].font = BOLD_FONT
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{total_assets_row}-{col}{total_liab_eq_row}"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        # Add conditional formatting would be nice but will skip for now
+    write_year_row(ws, row, 'Balance Check',
+                   lambda i, col, prev_col: f"={col}{total_assets_row}-{col}{total_liab_eq_row}",
+                   label_style='bold')
+    # Add conditional formatting would be nice but will skip for now
 
 def build_cash_flow_statement(wb):
     """Build the Cash Flow Statement"""
     ws = wb["Cash Flow"]
 
     # Set column widths
-    set_column_widths(ws, {
-        'A': 30, 'B': 15, 'C': 12, 'D': 12, 'E': 12, 'F': 12,
-        'G': 12, 'H': 12, 'I': 12, 'J': 12, 'K': 12
-    })
+    set_column_widths(ws, COLUMN_WIDTHS)
 
     # Title
-    ws['A1'] = 'CASH FLOW STATEMENT'
-    ws['A1'].font = Font(size=14, bold=True)
+    write_cell(ws, 1, 1, 'CASH FLOW STATEMENT', style='heading')
 
-    ws['A2'] = '($ in millions)'
-    ws['A2'].font = Font(italic=True)
+    write_cell(ws, 2, 1, '($ in millions)', style='units')
 
     # Years header
     row = 4
-    ws[f'A{row}'] = 'Period'
-    ws[f'A{row}'].font = BOLD_FONT
+    write_cell(ws, row, 1, 'Period', style='bold')
 
     col_start = 2  # Column B
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = year
-        ws[f'{col}{row}'].font = HEADER_FONT
-        ws[f'{col}{row}'].fill = HEADER_FILL
-        ws[f'{col}{row}'].alignment = Alignment(horizontal='center')
+    for col, year in enumerate(ALL_YEARS, col_start):
+        write_cell(ws, row, col, year, style='year_header')
 
     # Operating Activities
     row += 1
-    ws[f'A{row}'] = 'OPERATING ACTIVITIES'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
+    write_cell(ws, row, 1, 'OPERATING ACTIVITIES', style='section')
 
     # Net Income
     row += 1
-    ws[f'A{row}'] = 'Net Income'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"='Income Statement'!{col}19"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'Net Income', lambda i, col, prev_col: f"={INCOME_REF}{col}19")
 
     # D&A
     row += 1
-    ws[f'A{row}'] = 'D&A'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"='Income Statement'!{col}13"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'D&A', lambda i, col, prev_col: f"={INCOME_REF}{col}13")
 
     # Changes in Working Capital
     row += 1
-    ws[f'A{row}'] = 'Changes in Working Capital:'
-    ws[f'A{row}'].font = BOLD_FONT
+    write_cell(ws, row, 1, 'Changes in Working Capital:', style='bold')
 
-    # Change in AR
-    row += 1
-    ws[f'A{row}'] = 'Change in AR'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        if i == 0:
-            ws[f'{col}{row}'] = 0
-        else:
-            prev_col = get_column_letter(col_start + i - 1)
-            ws[f'{col}{row}'] = f"=-('Balance Sheet'!{col}8-'Balance Sheet'!{prev_col}8)"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-
-    # Change in Inventory
-    row += 1
-    ws[f'A{row}'] = 'Change in Inventory'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        if i == 0:
-            ws[f'{col}{row}'] = 0
-        else:
-            prev_col = get_column_letter(col_start + i - 1)
-            ws[f'{col}{row}'] = f"=-('Balance Sheet'!{col}9-'Balance Sheet'!{prev_col}9)"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-
-    # Change in Other CA
-    row += 1
-    ws[f'A{row}'] = 'Change in Other Current Assets'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        if i == 0:
-            ws[f'{col}{row}'] = 0
-        else:
-            prev_col = get_column_letter(col_start + i - 1)
-            ws[f'{col}{row}'] = f"=-('Balance Sheet'!{col}10-'Balance Sheet'!{prev_col}10)"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-
-    # Change in AP
-    row += 1
-    ws[f'A{row}'] = 'Change in AP'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        if i == 0:
-            ws[f'{col}{row}'] = 0
-        else:
-            prev_col = get_column_letter(col_start + i - 1)
-            ws[f'{col}{row}'] = f"='Balance Sheet'!{col}19-'Balance Sheet'!{prev_col}19"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-
-    # Change in Other CL
-    row += 1
-    ws[f'A{row}'] = 'Change in Other Current Liab'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        if i == 0:
-            ws[f'{col}{row}'] = 0
-        else:
-            prev_col = get_column_letter(col_start + i - 1)
-            ws[f'{col}{row}'] = f"='Balance Sheet'!{col}20-'Balance Sheet'!{prev_col}20"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    # Working capital changes: zero in 2021, then year-over-year BS movement
+    # (an increase in an asset uses cash, an increase in a liability provides it)
+    for label, bs_row, template in WORKING_CAPITAL_CHANGES:
+        row += 1
+        write_year_row(ws, row, label, lambda i, col, prev_col: (
+            0 if i == 0 else template.format(col=col, prev=prev_col, row=bs_row)))
 
     # Cash from Operations
     row += 1
     cfo_row = row
-    ws[f'A{row}'] = 'Cash from Operations'
-    ws[f'A{row}'].font = BOLD_FONT
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"=SUM({col}6:{col}{row-1})"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
+    write_year_row(ws, row, 'Cash from Operations',
+                   lambda i, col, prev_col: f"=SUM({col}6:{col}{cfo_row - 1})",
+                   style='bold_num', label_style='bold')
 
     # Investing Activities
     row += 2
-    ws[f'A{row}'] = 'INVESTING ACTIVITIES'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
+    write_cell(ws, row, 1, 'INVESTING ACTIVITIES', style='section')
 
     # CapEx
     row += 1
     capex_row = row
-    ws[f'A{row}'] = 'CapEx'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        year_col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"=-('Income Statement'!{col}7*'Assumptions & Drivers'!{year_col}26)"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'CapEx', lambda i, col, prev_col: (
+        f"=-({INCOME_REF}{col}7*{ASSUMPTIONS_REF}{col}26)"))
 
     # Cash from Investing
     row += 1
     cfi_row = row
-    ws[f'A{row}'] = 'Cash from Investing'
-    ws[f'A{row}'].font = BOLD_FONT
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{capex_row}"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
+    write_year_row(ws, row, 'Cash from Investing',
+                   lambda i, col, prev_col: f"={col}{capex_row}",
+                   style='bold_num', label_style='bold')
 
     # Financing Activities
     row += 2
-    ws[f'A{row}'] = 'FINANCING ACTIVITIES'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
+    write_cell(ws, row, 1, 'FINANCING ACTIVITIES', style='section')
 
-    # Net Borrowing (calculated to balance)
+    # Net Borrowing (calculated to balance): change in debt = ending debt - beginning debt
     row += 1
     net_borrow_row = row
-    ws[f'A{row}'] = 'Net Borrowing / (Repayment)'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        if i == 0:
-            ws[f'{col}{row}'] = 0
-        else:
-            prev_col = get_column_letter(col_start + i - 1)
-            # Change in debt = ending debt - beginning debt
-            ws[f'{col}{row}'] = f"='Balance Sheet'!{col}26-'Balance Sheet'!{prev_col}26"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'Net Borrowing / (Repayment)', lambda i, col, prev_col: (
+        0 if i == 0 else f"={BALANCE_REF}{col}26-{BALANCE_REF}{prev_col}26"))
 
     # Cash from Financing
     row += 1
     cff_row = row
-    ws[f'A{row}'] = 'Cash from Financing'
-    ws[f'A{row}'].font = BOLD_FONT
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{net_borrow_row}"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
+    write_year_row(ws, row, 'Cash from Financing',
+                   lambda i, col, prev_col: f"={col}{net_borrow_row}",
+                   style='bold_num', label_style='bold')
 
     # Net Change in Cash
     row += 2
-    ws[f'A{row}'] = 'Net Change in Cash'
-    ws[f'A{row}'].font = BOLD_FONT
     net_change_row = row
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{cfo_row}+{col}{cfi_row}+{col}{cff_row}"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
+    write_year_row(ws, row, 'Net Change in Cash',
+                   lambda i, col, prev_col: f"={col}{cfo_row}+{col}{cfi_row}+{col}{cff_row}",
+                   style='bold_num', label_style='bold')
 
-    # Beginning Cash
+    # Beginning Cash - links to prior ending cash
     row += 1
-    ws[f'A{row}'] = 'Beginning Cash'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        if i == 0:
-            ws[f'{col}{row}'] = "='Assumptions & Drivers'!B33"
-        else:
-            prev_col = get_column_letter(col_start + i - 1)
-            ws[f'{col}{row}'] = f"={prev_col}{row+1}"  # Link to prior ending cash
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    beg_cash_row = row
+    write_year_row(ws, row, 'Beginning Cash', lambda i, col, prev_col: (
+        f"={ASSUMPTIONS_REF}B33" if i == 0 else f"={prev_col}{beg_cash_row + 1}"))
 
     # Ending Cash (before revolver adjustment)
     row += 1
-    ws[f'A{row}'] = 'Ending Cash (before revolver)'
     prelim_cash_row = row
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{row-1}+{col}{net_change_row}"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
+    write_year_row(ws, row, 'Ending Cash (before revolver)',
+                   lambda i, col, prev_col: f"={col}{beg_cash_row}+{col}{net_change_row}")
 
     # Revolver logic
     row += 2
-    ws[f'A{row}'] = 'REVOLVER LOGIC'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
+    write_cell(ws, row, 1, 'REVOLVER LOGIC', style='section')
 
-    # Beginning Debt
+    # Beginning Debt - links to prior ending debt
     row += 1
     beg_debt_row = row
-    ws[f'A{row}'] = 'Beginning Debt'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        if i == 0:
-            ws[f'{col}{row}'] = "='Assumptions & Drivers'!B30"
-        else:
-            prev_col = get_column_letter(col_start + i - 1)
-            ws[f'{col}{row}'] = f"={prev_col}{row+1}"  # Link to prior ending debt
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-
-    # Ending Debt (with revolver)
+    write_year_row(ws, row, 'Beginning Debt', lambda i, col, prev_col: (
+        f"={ASSUMPTIONS_REF}B30" if i == 0 else f"={prev_col}{beg_debt_row + 1}"))
+
+    # Ending Debt (with revolver): draw if cash would be negative, pay down if positive
     row += 1
     end_debt_row = row
-    ws[f'A{row}'] = 'Ending Debt'
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        # If cash would be negative, draw on revolver. If positive, pay down debt.
-        ws[f'{col}{row}'] = f"=MAX(0,{col}{beg_debt_row}-{col}{prelim_cash_row})"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-
-    # Ending Cash (final)
+    write_year_row(ws, row, 'Ending Debt',
+                   lambda i, col, prev_col: f"=MAX(0,{col}{beg_debt_row}-{col}{prelim_cash_row})")
+
+    # Ending Cash (final) = prelim cash + debt draw or - debt paydown
     row += 1
-    end_cash_row = row
-    ws[f'A{row}'] = 'Ending Cash'
-    ws[f'A{row}'].font = BOLD_FONT
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        # Cash = prelim cash + debt draw or - debt paydown
-        ws[f'{col}{row}'] = f"={col}{prelim_cash_row}+{col}{beg_debt_row}-{col}{end_debt_row}"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
+    write_year_row(ws, row, 'Ending Cash', lambda i, col, prev_col: (
+        f"={col}{prelim_cash_row}+{col}{beg_debt_row}-{col}{end_debt_row}"),
+        style='bold_num', label_style='bold')
 
     # Free Cash Flow
     row += 2
-    ws[f'A{row}'] = 'KEY METRICS'
-    ws[f'A{row}'].font = BOLD_FONT
-    ws[f'A{row}'].fill = SECTION_FILL
+    write_cell(ws, row, 1, 'KEY METRICS', style='section')
 
     row += 1
-    fcf_row = row
-    ws[f'A{row}'] = 'Free Cash Flow'
-    ws[f'A{row}'].font = BOLD_FONT
-    for i, year in enumerate(ALL_YEARS):
-        col = get_column_letter(col_start + i)
-        ws[f'{col}{row}'] = f"={col}{cfo_row}+{col}{capex_row}"
-        ws[f'{col}{row}'].number_format = '#,##0.0'
-        ws[f'{col}{row}'].font = BOLD_FONT
+    write_year_row(ws, row, 'Free Cash Flow',
+                   lambda i, col, prev_col: f"={col}{cfo_row}+{col}{capex_row}",
+                   style='bold_num', label_style='bold')
 
 def build_charts(wb):
     """Build the Charts sheet"""
@@ -1080,74 +689,38 @@ def build_charts(wb):
     set_column_widths(ws, {'A': 20, 'B': 15, 'C': 15, 'D': 15})
 
     # Title
-    ws['A1'] = 'KEY CHARTS & VISUALIZATIONS'
-    ws['A1'].font = Font(size=14, bold=True)
-
-    # Data table for reference
-    ws['A3'] = 'Year'
-    ws['B3'] = 'Revenue'
-    ws['C3'] = 'EBITDA'
-    ws['D3'] = 'Free Cash Flow'
-
-    for i, cell in enumerate(['A3', 'B3', 'C3', 'D3']):
-        ws[cell].font = BOLD_FONT
-        ws[cell].fill = HEADER_FILL
-
-    # Populate data
-    for i, year in enumerate(ALL_YEARS):
-        row = 4 + i
-        col_letter = get_column_letter(2 + i)
-
-        ws[f'A{row}'] = year
-        ws[f'B{row}'] = f"='Income Statement'!{col_letter}7"
-        ws[f'C{row}'] = f"='Income Statement'!{col_letter}22"
-        ws[f'D{row}'] = f"='Cash Flow'!{col_letter}36"
-
-        ws[f'B{row}'].number_format = '#,##0.0'
-        ws[f'C{row}'].number_format = '#,##0.0'
-        ws[f'D{row}'].number_format = '#,##0.0'
-
-    # Revenue Chart
-    chart1 = LineChart()
-    chart1.title = "Revenue Growth"
-    chart1.style = 13
-    chart1.y_axis.title = '$ millions'
-    chart1.x_axis.title = 'Year'
-
-    data1 = Reference(ws, min_col=2, min_row=3, max_row=3+len(ALL_YEARS))
-    cats1 = Reference(ws, min_col=1, min_row=4, max_row=3+len(ALL_YEARS))
-    chart1.add_data(data1, titles_from_data=True)
-    chart1.set_categories(cats1)
-
-    ws.add_chart(chart1, "F3")
-
-    # EBITDA Chart
-    chart2 = LineChart()
-    chart2.title = "EBITDA Trend"
-    chart2.style = 13
-    chart2.y_axis.title = '$ millions'
-    chart2.x_axis.title = 'Year'
-
-    data2 = Reference(ws, min_col=3, min_row=3, max_row=3+len(ALL_YEARS))
-    cats2 = Reference(ws, min_col=1, min_row=4, max_row=3+len(ALL_YEARS))
-    chart2.add_data(data2, titles_from_data=True)
-    chart2.set_categories(cats2)
-
-    ws.add_chart(chart2, "F18")
-
-    # FCF Chart
-    chart3 = LineChart()
-    chart3.title = "Free Cash Flow"
-    chart3.style = 13
-    chart3.y_axis.title = '$ millions'
-    chart3.x_axis.title = 'Year'
-
-    data3 = Reference(ws, min_col=4, min_row=3, max_row=3+len(ALL_YEARS))
-    cats3 = Reference(ws, min_col=1, min_row=4, max_row=3+len(ALL_YEARS))
-    chart3.add_data(data3, titles_from_data=True)
-    chart3.set_categories(cats3)
-
-    ws.add_chart(chart3, "F33")
+    write_cell(ws, 1, 1, 'KEY CHARTS & VISUALIZATIONS', style='heading')
+
+    # Data table for reference: header row, then one row per year down to last_row
+    header_row = 3
+    last_row = header_row + len(ALL_YEARS)
+    for col, header in enumerate(('Year', 'Revenue', 'EBITDA', 'Free Cash Flow'), 1):
+        write_cell(ws, header_row, col, header, style='table_header')
+
+    # Populate data: one row per year below the header
+    for row, (year, col_letter) in enumerate(zip(ALL_YEARS, YEAR_COLS), header_row + 1):
+        ws.cell(row=row, column=1, value=year)
+        for col, value in enumerate((f"={INCOME_REF}{col_letter}7",
+                                     f"={INCOME_REF}{col_letter}22",
+                                     f"={CASH_FLOW_REF}{col_letter}36"), 2):
+            write_cell(ws, row, col, value, style='num')
+
+    # Revenue, EBITDA and FCF line charts, one per data column, sharing the year categories
+    cats = Reference(ws, min_col=1, min_row=header_row + 1, max_row=last_row)
+    for title, data_col, anchor in (("Revenue Growth", 2, "F3"),
+                                    ("EBITDA Trend", 3, "F18"),
+                                    ("Free Cash Flow", 4, "F33")):
+        chart = LineChart()
+        chart.title = title
+        chart.style = 13
+        chart.y_axis.title = '$ millions'
+        chart.x_axis.title = 'Year'
+
+        chart.add_data(Reference(ws, min_col=data_col, min_row=header_row, max_row=last_row),
+                       titles_from_data=True)
+        chart.set_categories(cats)
+
+        ws.add_chart(chart, anchor)
 
 def main():
     """Main function to build the complete model"""
@@ -1180,7 +753,7 @@ def main():
 
     # Save the file
     filename = "3_Statement_Financial_Model.xlsx"
-    wb.save(filename)
+    save_workbook(wb, filename)
     print(f"\n✓ Model saved as {filename}")
     print("\nModel features:")
     print("  • Historical years: 2021-2024")